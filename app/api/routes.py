@@ -5,28 +5,55 @@ FastAPI routes for manual control and status monitoring.
 """
 
 import logging
-from typing import Optional
-from pathlib import Path
+import secrets
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
 
-from fastapi import APIRouter, HTTPException, BackgroundTasks, Query
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse
+from starlette.concurrency import run_in_threadpool
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.scheduler.jobs import ingestion_job, health_check_job
 from app.services.storage import storage_service
 from app.services.reconcile import reconciliation_service
-from app.db.repo import DatabaseRepository
+from app.services.emailer import emailer_service
+from app.db.repo import repository
 from app.config import settings
 
-repository = DatabaseRepository(db_url=settings.DATABASE_URL)
-
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Dedicated single worker for ingestion so long runs never occupy the
+# shared threadpool that serves the other endpoints
+ingest_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ingest")
+
+# Short-lived response cache for endpoints polled by monitoring tools
+HEALTH_CACHE_TTL_SECONDS = 10
+CONFIG_CACHE_TTL_SECONDS = 60
+_response_cache: dict = {}  # key -> (stored_at, value)
+
+
+def _get_cached(key: str, ttl: float) -> Optional[Any]:
+    """Return a cached value if it is younger than ttl seconds."""
+    entry = _response_cache.get(key)
+    if entry is not None and time.monotonic() - entry[0] < ttl:
+        return entry[1]
+    return None
+
+
+def _set_cached(key: str, value: Any) -> None:
+    """Store a value in the response cache."""
+    _response_cache[key] = (time.monotonic(), value)
+
 
 # Request/Response Models
 class RunIngestionRequest(BaseModel):
     """Request model for triggering ingestion."""
+    model_config = ConfigDict(frozen=True)
+    
     zip_path: Optional[str] = Field(
         None,
         description="Optional path to specific ZIP file. If not provided, uses latest from incoming/"
@@ -35,6 +62,8 @@ class RunIngestionRequest(BaseModel):
 
 class RunIngestionResponse(BaseModel):
     """Response model for ingestion trigger."""
+    model_config = ConfigDict(frozen=True)
+    
     message: str
     run_id: str
     status: str
@@ -42,6 +71,8 @@ class RunIngestionResponse(BaseModel):
 
 class LastRunResponse(BaseModel):
     """Response model for last run status."""
+    model_config = ConfigDict(frozen=True)
+    
     run_id: str
     start_time: str
     end_time: Optional[str]
@@ -53,6 +84,8 @@ class LastRunResponse(BaseModel):
 
 class HealthResponse(BaseModel):
     """Response model for detailed health check."""
+    model_config = ConfigDict(frozen=True)
+    
     timestamp: str
     status: str
     components: dict
@@ -61,6 +94,8 @@ class HealthResponse(BaseModel):
 
 class StorageStatsResponse(BaseModel):
     """Response model for storage statistics."""
+    model_config = ConfigDict(frozen=True)
+    
     incoming: dict
     raw_archive: dict
     output: dict
@@ -68,31 +103,35 @@ class StorageStatsResponse(BaseModel):
 
 # Routes
 
-@router.get("/health", response_model=HealthResponse)
+@router.get("/health", responses={200: {"model": HealthResponse}})
 async def get_health():
     """
     Get detailed system health status.
     
     Returns health status of all components including database, storage, and email.
+    Results are cached for a few seconds to absorb frequent polling.
     """
+    cached = _get_cached("health", HEALTH_CACHE_TTL_SECONDS)
+    if cached is not None:
+        return ORJSONResponse(content=cached)
+    
     try:
-        health_status = health_check_job.run_health_check()
-        return health_status
+        health_status = await run_in_threadpool(health_check_job.run_health_check)
+        _set_cached("health", health_status)
+        return ORJSONResponse(content=health_status)
     except Exception as e:
-        logger.error(f"Health check failed: {e}", exc_info=True)
+        logger.error("Health check failed: %s", e)
         raise HTTPException(status_code=500, detail=f"Health check failed: {str(e)}")
 
 
-@router.post("/run-now", response_model=RunIngestionResponse)
-async def run_now(
-    request: RunIngestionRequest,
-    background_tasks: BackgroundTasks
-):
+@router.post("/run-now", response_model=RunIngestionResponse, status_code=202)
+async def run_now(request: RunIngestionRequest):
     """
     Trigger data ingestion immediately.
     
     This endpoint starts ingestion in the background and returns immediately.
-    Use /last-run to check status.
+    Use /last-run to check status; a missing ZIP path is reported there as
+    the run error rather than checked on the request path.
     
     Args:
         request: Optional ZIP file path
@@ -107,26 +146,16 @@ async def run_now(
             detail="Ingestion job is already running"
         )
     
-    # Validate ZIP path if provided
-    if request.zip_path:
-        zip_file = Path(request.zip_path)
-        if not zip_file.exists():
-            raise HTTPException(
-                status_code=404,
-                detail=f"ZIP file not found: {request.zip_path}"
-            )
-    
-    # Run in background
-    def run_task():
-        ingestion_job.run_ingestion(zip_path=request.zip_path)
-    
-    background_tasks.add_task(run_task)
+    # Run on the dedicated ingestion worker
+    ingestion_job.current_future = ingest_executor.submit(
+        ingestion_job.run_ingestion,
+        zip_path=request.zip_path
+    )
     
     # Generate temporary run ID for response
-    import uuid
-    run_id = str(uuid.uuid4())[:8]
+    run_id = secrets.token_hex(4)
     
-    logger.info(f"Ingestion triggered via API [run_id: {run_id}]")
+    logger.info("Ingestion triggered via API [run_id: %s]", run_id)
     
     return RunIngestionResponse(
         message="Ingestion started in background",
@@ -135,7 +164,7 @@ async def run_now(
     )
 
 
-@router.get("/last-run", response_model=Optional[LastRunResponse])
+@router.get("/last-run", responses={200: {"model": Optional[LastRunResponse]}})
 async def get_last_run():
     """
     Get status of the last completed ingestion run.
@@ -148,7 +177,10 @@ async def get_last_run():
     if not last_run:
         return None
     
-    return LastRunResponse(**last_run)
+    # Expose only the documented fields (internal keys such as traceback stay private)
+    return ORJSONResponse(
+        content={field: last_run.get(field) for field in LastRunResponse.model_fields}
+    )
 
 
 @router.get("/current-run")
@@ -159,10 +191,11 @@ async def get_current_run():
     Returns:
         Current run status or null if not running
     """
-    if ingestion_job.is_running():
+    running, run_id = ingestion_job.snapshot()
+    if running:
         return {
             "running": True,
-            "run_id": ingestion_job.current_run_id,
+            "run_id": run_id,
             "message": "Ingestion in progress"
         }
     else:
@@ -173,7 +206,7 @@ async def get_current_run():
         }
 
 
-@router.get("/storage/stats", response_model=StorageStatsResponse)
+@router.get("/storage/stats", responses={200: {"model": StorageStatsResponse}})
 async def get_storage_stats():
     """
     Get storage statistics for all directories.
@@ -182,10 +215,10 @@ async def get_storage_stats():
         File counts and sizes for incoming, raw_archive, and output directories
     """
     try:
-        stats = storage_service.get_storage_stats()
-        return stats
+        stats = await run_in_threadpool(storage_service.get_storage_stats)
+        return ORJSONResponse(content=stats)
     except Exception as e:
-        logger.error(f"Failed to get storage stats: {e}", exc_info=True)
+        logger.error("Failed to get storage stats: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to retrieve storage stats: {str(e)}"
@@ -204,10 +237,10 @@ async def list_archived_files(limit: int = Query(10, ge=1, le=100)):
         List of archived files with metadata
     """
     try:
-        files = storage_service.list_archived_zips(limit=limit)
+        files = await run_in_threadpool(storage_service.list_archived_zips, limit=limit)
         return {"files": files, "count": len(files)}
     except Exception as e:
-        logger.error(f"Failed to list archived files: {e}", exc_info=True)
+        logger.error("Failed to list archived files: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to list archived files: {str(e)}"
@@ -226,10 +259,10 @@ async def list_output_files(limit: int = Query(10, ge=1, le=100)):
         List of output files with metadata
     """
     try:
-        files = storage_service.list_output_zips(limit=limit)
+        files = await run_in_threadpool(storage_service.list_output_zips, limit=limit)
         return {"files": files, "count": len(files)}
     except Exception as e:
-        logger.error(f"Failed to list output files: {e}", exc_info=True)
+        logger.error("Failed to list output files: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to list output files: {str(e)}"
@@ -262,7 +295,7 @@ async def get_reconciliation_history(limit: int = Query(10, ge=1, le=50)):
         List of reconciliation reports (most recent first)
     """
     reports = reconciliation_service.get_report_history(limit=limit)
-    return {"reports": reports, "count": len(reports)}
+    return ORJSONResponse(content={"reports": reports, "count": len(reports)})
 
 
 @router.get("/db/stats")
@@ -274,13 +307,13 @@ async def get_database_stats():
         Record counts for all tables
     """
     try:
-        stats = repository.get_table_counts()
+        stats, total = await run_in_threadpool(repository.get_table_counts_with_total)
         return {
             "tables": stats,
-            "total_records": sum(stats.values())
+            "total_records": total
         }
     except Exception as e:
-        logger.error(f"Failed to get database stats: {e}", exc_info=True)
+        logger.error("Failed to get database stats: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to retrieve database stats: {str(e)}"
@@ -296,10 +329,10 @@ async def vacuum_database():
         Confirmation message
     """
     try:
-        repository.vacuum()
+        await run_in_threadpool(repository.vacuum)
         return {"message": "Database vacuumed successfully"}
     except Exception as e:
-        logger.error(f"Failed to vacuum database: {e}", exc_info=True)
+        logger.error("Failed to vacuum database: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to vacuum database: {str(e)}"
@@ -314,7 +347,9 @@ async def get_config():
     Returns:
         Configuration dictionary with sensitive values masked
     """
-    from app.config import settings
+    cached = _get_cached("config", CONFIG_CACHE_TTL_SECONDS)
+    if cached is not None:
+        return cached
     
     config = {
         "scheduler_enabled": settings.SCHEDULER_ENABLED,
@@ -328,25 +363,27 @@ async def get_config():
         "smtp_host": settings.SMTP_HOST,
         "smtp_port": settings.SMTP_PORT,
         "from_email": settings.FROM_EMAIL,
-        "recipient_count": len(settings.recipient_emails_list) if settings.recipient_emails_list else 0,
+        "recipient_count": len(settings.RECIPIENT_EMAILS) if settings.RECIPIENT_EMAILS else 0,
         "delete_incoming_after_processing": settings.DELETE_INCOMING_AFTER_PROCESSING,
         "database_url": settings.DATABASE_URL.split("@")[-1] if "@" in settings.DATABASE_URL else "sqlite",
         "log_level": settings.LOG_LEVEL
     }
     
+    _set_cached("config", config)
     return config
 
 
 @router.post("/test/email")
-async def test_email():
+async def test_email(force: bool = Query(False, description="Bypass the cached probe result")):
     """
     Test email configuration by attempting connection.
     
+    The probe result is cached briefly by the emailer service; pass
+    force=true to re-test immediately.
+    
     Returns:
         Test result
     """
-    from app.services.emailer import emailer_service
-    
     if not emailer_service.enabled:
         raise HTTPException(
             status_code=400,
@@ -354,7 +391,7 @@ async def test_email():
         )
     
     try:
-        success = emailer_service.test_connection()
+        success = await run_in_threadpool(emailer_service.test_connection, force=force)
         if success:
             return {"message": "Email configuration test successful"}
         else:
@@ -362,8 +399,10 @@ async def test_email():
                 status_code=500,
                 detail="Email configuration test failed"
             )
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"Email test failed: {e}", exc_info=True)
+        logger.error("Email test failed: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Email test failed: {str(e)}"
@@ -14,12 +14,14 @@ Usage:
 """
 
 import sys
+import atexit
 import logging
 from pathlib import Path
 from typing import Optional
 import click
 
 from app.config import settings
+from app.logging_setup import configure_logging
 from app.scheduler.jobs import ingestion_job, health_check_job
 from app.services.storage import storage_service
 from app.services.reconcile import reconciliation_service
@@ -27,15 +29,10 @@ from app.services.emailer import emailer_service
 from app.db.models import init_db
 from app.db.repo import repository
 
-# Configure logging for CLI
-logging.basicConfig(
-    level=getattr(logging, settings.LOG_LEVEL.upper()),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler(settings.LOG_FILE)
-    ]
-)
+# Configure logging for CLI (queued; the listener runs for the process lifetime)
+_log_listener = configure_logging()
+_log_listener.start()
+atexit.register(_log_listener.stop)  # Flush pending records on exit
 
 logger = logging.getLogger(__name__)
 
@@ -84,57 +81,61 @@ def run_once(zip_path: Optional[str], init_db_flag: bool):
     try:
         run_status = ingestion_job.run_ingestion(zip_path=zip_path)
         
-        # Display results
-        click.echo("\n" + "=" * 70)
+        # Display results (buffered and written in one call)
+        out = ["\n" + "=" * 70]
         if run_status["status"] == "SUCCESS":
-            click.echo("✓ INGESTION COMPLETED SUCCESSFULLY")
-            click.secho("Status: SUCCESS", fg="green", bold=True)
+            out.append("✓ INGESTION COMPLETED SUCCESSFULLY")
+            out.append(click.style("Status: SUCCESS", fg="green", bold=True))
         else:
-            click.echo("✗ INGESTION FAILED")
-            click.secho(f"Status: {run_status['status']}", fg="red", bold=True)
-        click.echo("=" * 70)
+            out.append("✗ INGESTION FAILED")
+            out.append(click.style(f"Status: {run_status['status']}", fg="red", bold=True))
+        out.append("=" * 70)
         
         # Display stats
-        click.echo(f"\nRun ID: {run_status['run_id']}")
-        click.echo(f"Start Time: {run_status['start_time']}")
-        click.echo(f"End Time: {run_status['end_time']}")
+        out.append(f"\nRun ID: {run_status['run_id']}")
+        out.append(f"Start Time: {run_status['start_time']}")
+        out.append(f"End Time: {run_status['end_time']}")
         
         if "stats" in run_status and run_status["stats"]:
-            click.echo("\n📊 Statistics:")
+            out.append("\n📊 Statistics:")
             stats = run_status["stats"]
             
             if "source_file" in stats:
-                click.echo(f"  Source File: {stats['source_file']}")
+                out.append(f"  Source File: {stats['source_file']}")
             
             if "db_counts" in stats:
-                click.echo("\n  Database Records Inserted:")
-                for table, count in stats["db_counts"].items():
-                    click.echo(f"    • {table}: {count:,}")
+                out.append("\n  Database Records Inserted:")
+                out.append("\n".join(
+                    f"    • {table}: {count:,}" for table, count in stats["db_counts"].items()
+                ))
             
             if "reconciliation" in stats:
                 recon = stats["reconciliation"]
-                click.echo(f"\n  Reconciliation: {recon['status']}")
-                click.echo(f"    Matched: {recon['matched_tables']}/{recon['total_tables']} tables")
+                out.append(f"\n  Reconciliation: {recon['status']}")
+                out.append(f"    Matched: {recon['matched_tables']}/{recon['total_tables']} tables")
             
             if "output_file" in stats:
-                click.echo(f"\n  Output Package: {stats['output_file']}")
+                out.append(f"\n  Output Package: {stats['output_file']}")
             
             if "email_sent" in stats:
-                if stats["email_sent"]:
-                    click.echo("  ✓ Email sent successfully")
+                if stats["email_sent"] == "QUEUED":
+                    out.append("  ✉ Email queued for sending")
+                elif stats["email_sent"]:
+                    out.append("  ✓ Email sent successfully")
                 else:
-                    click.echo("  ⚠ Email not sent")
+                    out.append("  ⚠ Email not sent")
         
         # Display error if present
         if run_status.get("error"):
-            click.echo("\n❌ Error Details:")
-            click.secho(run_status["error"], fg="red")
+            out.append("\n❌ Error Details:")
+            out.append(click.style(run_status["error"], fg="red"))
             
             if run_status.get("traceback"):
-                click.echo("\nTraceback:")
-                click.echo(run_status["traceback"])
+                out.append("\nTraceback:")
+                out.append(run_status["traceback"])
         
-        click.echo("\n" + "=" * 70)
+        out.append("\n" + "=" * 70)
+        click.echo("\n".join(out))
         
         # Exit with appropriate code
         sys.exit(0 if run_status["status"] == "SUCCESS" else 1)
@@ -207,11 +208,13 @@ def list_archived(limit: int):
         if not files:
             click.echo("  No archived files found")
         else:
+            out = []
             for i, file_info in enumerate(files, 1):
-                click.echo(f"{i}. {file_info['filename']}")
-                click.echo(f"   Size: {file_info['size_mb']:.2f} MB")
-                click.echo(f"   Modified: {file_info['modified']}")
-                click.echo()
+                out.append(f"{i}. {file_info['filename']}")
+                out.append(f"   Size: {file_info['size_mb']:.2f} MB")
+                out.append(f"   Modified: {file_info['modified']}")
+                out.append("")
+            click.echo("\n".join(out))
         
     except Exception as e:
         click.secho(f"❌ Failed to list archived files: {e}", fg="red", err=True)
@@ -230,11 +233,13 @@ def list_output(limit: int):
         if not files:
             click.echo("  No output files found")
         else:
+            out = []
             for i, file_info in enumerate(files, 1):
-                click.echo(f"{i}. {file_info['filename']}")
-                click.echo(f"   Size: {file_info['size_mb']:.2f} MB")
-                click.echo(f"   Modified: {file_info['modified']}")
-                click.echo()
+                out.append(f"{i}. {file_info['filename']}")
+                out.append(f"   Size: {file_info['size_mb']:.2f} MB")
+                out.append(f"   Modified: {file_info['modified']}")
+                out.append("")
+            click.echo("\n".join(out))
         
     except Exception as e:
         click.secho(f"❌ Failed to list output files: {e}", fg="red", err=True)
@@ -247,17 +252,16 @@ def db_stats():
     click.echo("📊 Database Statistics:\n")
     
     try:
-        stats = repository.get_table_counts()
+        stats, total = repository.get_table_counts_with_total()
         
         if not stats:
             click.echo("  No tables found or database is empty")
         else:
-            total = 0
-            for table_name, count in sorted(stats.items()):
-                click.echo(f"  {table_name}: {count:,} records")
-                total += count
-            
-            click.echo(f"\n  Total Records: {total:,}")
+            table_lines = "\n".join(
+                f"  {table_name}: {count:,} records"
+                for table_name, count in sorted(stats.items())
+            )
+            click.echo(f"{table_lines}\n\n  Total Records: {total:,}")
         
     except Exception as e:
         click.secho(f"❌ Failed to get database stats: {e}", fg="red", err=True)
@@ -285,7 +289,7 @@ def test_email():
         click.echo(f"From Email: {emailer_service.from_email}")
         click.echo()
         
-        success = emailer_service.test_connection()
+        success = emailer_service.test_connection(force=True)
         
         if success:
             click.secho("✓ Email configuration test PASSED", fg="green", bold=True)
@@ -315,29 +319,33 @@ def reconciliation(limit: int, detailed: bool):
             click.echo("  No reconciliation reports found")
             sys.exit(0)
         
+        out = []
         for i, report in enumerate(reports, 1):
-            click.echo(f"\n{i}. Run ID: {report.get('run_id', 'N/A')}")
-            click.echo(f"   Timestamp: {report['timestamp']}")
+            out.append(f"\n{i}. Run ID: {report.get('run_id', 'N/A')}")
+            out.append(f"   Timestamp: {report['timestamp']}")
             
             status = report['status']
             if status == "SUCCESS":
-                click.secho(f"   Status: {status}", fg="green")
+                out.append(click.style(f"   Status: {status}", fg="green"))
             elif status == "PARTIAL":
-                click.secho(f"   Status: {status}", fg="yellow")
+                out.append(click.style(f"   Status: {status}", fg="yellow"))
             else:
-                click.secho(f"   Status: {status}", fg="red")
+                out.append(click.style(f"   Status: {status}", fg="red"))
             
             summary = report['summary']
-            click.echo(f"   Tables Matched: {summary['tables_matched']}/{summary['total_tables']}")
-            click.echo(f"   Total Records: Source={summary['total_source_records']:,}, DB={summary['total_db_records']:,}")
+            out.append(f"   Tables Matched: {summary['tables_matched']}/{summary['total_tables']}")
+            out.append(f"   Total Records: Source={summary['total_source_records']:,}, DB={summary['total_db_records']:,}")
             
             if detailed:
-                click.echo("\n   Table Details:")
-                for table_name, table_report in report['tables'].items():
-                    match_icon = "✓" if table_report['matched'] else "✗"
-                    click.echo(f"     {match_icon} {table_name}: Source={table_report['source_count']}, DB={table_report['db_count']}")
+                out.append("\n   Table Details:")
+                out.append("\n".join(
+                    f"     {'✓' if table_report['matched'] else '✗'} {table_name}: "
+                    f"Source={table_report['source_count']}, DB={table_report['db_count']}"
+                    for table_name, table_report in report['tables'].items()
+                ))
             
-            click.echo("   " + "-" * 60)
+            out.append("   " + "-" * 60)
+        click.echo("\n".join(out))
         
     except Exception as e:
         click.secho(f"❌ Failed to get reconciliation reports: {e}", fg="red", err=True)
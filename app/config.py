@@ -5,183 +5,250 @@ Configuration management using environment variables.
 Loads settings from .env file and provides typed configuration objects.
 """
 import os
+import sys
+import threading
 from pathlib import Path
-from typing import List, Optional
+from typing import Annotated, FrozenSet, Optional, Tuple
 from datetime import datetime
-import pytz
-from pydantic_settings import BaseSettings
-from pydantic import Field, field_validator
+from functools import cached_property, lru_cache
+from pydantic_settings import BaseSettings, NoDecode, PydanticBaseSettingsSource
+from pydantic import Field, ValidationInfo, field_validator
+
+# Day-of-week keys (APScheduler cron format) and their display names
+_DAY_NAMES = {
+    'mon': 'Monday',
+    'tue': 'Tuesday',
+    'wed': 'Wednesday',
+    'thu': 'Thursday',
+    'fri': 'Friday',
+    'sat': 'Saturday',
+    'sun': 'Sunday'
+}
+_VALID_DAYS = frozenset(_DAY_NAMES)
+
+@lru_cache(maxsize=32)
+def _tz_cached(name: str):
+    """Resolve a timezone name (zoneinfo is imported on first use only)."""
+    from zoneinfo import ZoneInfo
+    return ZoneInfo(name)
+
+# Defaults for comma-separated list settings (also used when the value is empty)
+_DEFAULT_CORS_ORIGINS = ("http://localhost:3000", "http://localhost:8000")
+_DEFAULT_EXPECTED_TABLES = (
+    "participants", "conversations", "messages", "connections", "profile", "reactions"
+)
+_CSV_FALLBACKS = {
+    "CORS_ORIGINS": _DEFAULT_CORS_ORIGINS,
+    "EXPECTED_TABLES": _DEFAULT_EXPECTED_TABLES,
+}
+
+# Settings that must be non-empty when EMAIL_ENABLED
+_EMAIL_REQUIRED = ("SMTP_HOST", "SMTP_USER", "SMTP_PASSWORD", "FROM_EMAIL")
+
+
+def _split_csv(value: str) -> Tuple[str, ...]:
+    """Split a comma-separated setting into stripped, interned, non-empty items."""
+    return tuple(
+        sys.intern(item)
+        for item in (part.strip() for part in value.split(','))
+        if item
+    )
+
+
+# ensure_directories() only needs to touch the filesystem once per process
+_dirs_ready = False
+_dirs_lock = threading.Lock()
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
     
     # ==================== APPLICATION ====================
     APP_NAME: str = "LinkedIn Data Ingestor"
-    DEBUG: bool = Field(default=False, description="Enable debug mode")
-    PORT: int = Field(default=8000, description="API server port")
-    LOG_LEVEL: str = Field(default="INFO", description="Logging level")
-    LOG_FILE: str = Field(default="app/logs/ingestor.log", description="Log file path")
+    DEBUG: bool = False  # Enable debug mode
+    PORT: int = 8000  # API server port
+    LOG_LEVEL: str = "INFO"  # Logging level
+    LOG_FILE: str = "app/logs/ingestor.log"  # Log file path
     
     # ==================== DIRECTORIES ====================
     BASE_DIR: Path = Field(default_factory=lambda: Path(__file__).parent.parent)
-    INCOMING_DIR: str = Field(default="data/incoming", description="Directory for incoming LinkedIn exports")
-    RAW_ZIP_DIR: str = Field(default="data/raw_zip", description="Archive directory for processed raw ZIPs")
-    OUT_ZIP_DIR: str = Field(default="data/out_zip", description="Directory for generated output packages")
+    INCOMING_DIR: str = "data/incoming"  # Directory for incoming LinkedIn exports
+    RAW_ZIP_DIR: str = "data/raw_zip"  # Archive directory for processed raw ZIPs
+    OUT_ZIP_DIR: str = "data/out_zip"  # Directory for generated output packages
     
-    @property
+    @cached_property
     def incoming_path(self) -> Path:
-        """Get absolute path for incoming directory."""
-        return self.BASE_DIR / self.INCOMING_DIR
+        """Get absolute path for incoming directory (resolved once)."""
+        return (self.BASE_DIR / self.INCOMING_DIR).resolve()
     
-    @property
+    @cached_property
     def raw_zip_path(self) -> Path:
-        """Get absolute path for raw zip archive directory."""
-        return self.BASE_DIR / self.RAW_ZIP_DIR
+        """Get absolute path for raw zip archive directory (resolved once)."""
+        return (self.BASE_DIR / self.RAW_ZIP_DIR).resolve()
     
-    @property
+    @cached_property
     def out_zip_path(self) -> Path:
-        """Get absolute path for output zip directory."""
-        return self.BASE_DIR / self.OUT_ZIP_DIR
+        """Get absolute path for output zip directory (resolved once)."""
+        return (self.BASE_DIR / self.OUT_ZIP_DIR).resolve()
     
     # ==================== DATABASE ====================
-    DATABASE_URL: str = Field(
-        default="sqlite:///./linkedin_data.db",
-        description="Database connection URL (SQLite or PostgreSQL)"
-    )
-    DB_ECHO: bool = Field(default=False, description="Echo SQL queries (debug)")
-    DB_POOL_SIZE: int = Field(default=5, description="Database connection pool size")
-    DB_MAX_OVERFLOW: int = Field(default=10, description="Max overflow connections")
+    DATABASE_URL: str = "sqlite:///./linkedin_data.db"  # Database connection URL (SQLite or PostgreSQL)
+    DB_ECHO: bool = False  # Echo SQL queries (debug)
+    DB_POOL_SIZE: int = 5  # Database connection pool size
+    DB_MAX_OVERFLOW: int = 10  # Max overflow connections
+    DB_POOL_RECYCLE: int = 1800  # Seconds before a pooled connection is replaced
     
     # ==================== SCHEDULER ====================
-    SCHEDULER_ENABLED: bool = Field(default=True, description="Enable automatic scheduled ingestion")
-    SCHEDULE_DAY_OF_WEEK: str = Field(default="mon", description="Day of week for ingestion (mon-sun)")
-    SCHEDULE_HOUR: int = Field(default=9, ge=0, le=23, description="Hour for ingestion (0-23)")
-    SCHEDULE_MINUTE: int = Field(default=0, ge=0, le=59, description="Minute for ingestion (0-59)")
-    TIMEZONE: str = Field(default="UTC", description="Timezone for scheduler")
+    SCHEDULER_ENABLED: bool = True  # Enable automatic scheduled ingestion
+    SCHEDULE_DAY_OF_WEEK: str = "mon"  # Day of week for ingestion (mon-sun)
+    SCHEDULE_HOUR: int = Field(default=9, ge=0, le=23)  # Hour for ingestion (0-23)
+    SCHEDULE_MINUTE: int = Field(default=0, ge=0, le=59)  # Minute for ingestion (0-59)
+    TIMEZONE: str = "UTC"  # Timezone for scheduler
     
     @field_validator('TIMEZONE')
     @classmethod
     def validate_timezone(cls, v):
         """Validate timezone string."""
+        from zoneinfo import ZoneInfoNotFoundError
+        
         try:
-            pytz.timezone(v)
+            _tz_cached(v)
             return v
-        except pytz.exceptions.UnknownTimeZoneError:
+        except (ZoneInfoNotFoundError, ValueError):
             raise ValueError(f"Invalid timezone: {v}")
     
     @field_validator('SCHEDULE_DAY_OF_WEEK')
     @classmethod
     def validate_day_of_week(cls, v):
         """Validate day of week."""
-        valid_days = ['mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun']
         v_lower = v.lower()
-        if v_lower not in valid_days:
-            raise ValueError(f"Invalid day of week: {v}. Must be one of {valid_days}")
+        if v_lower not in _VALID_DAYS:
+            raise ValueError(f"Invalid day of week: {v}. Must be one of {list(_DAY_NAMES)}")
         return v_lower
         
     
     # ==================== EMAIL ====================
-    EMAIL_ENABLED: bool = Field(default=False, description="Enable email notifications")
-    SMTP_HOST: str = Field(default="", description="SMTP server host")
-    SMTP_PORT: int = Field(default=587, description="SMTP server port")
-    SMTP_USER: str = Field(default="", description="SMTP username/email")
-    SMTP_PASSWORD: str = Field(default="", description="SMTP password/app password")
-    SMTP_USE_TLS: bool = Field(default=True, description="Use TLS for SMTP")
-    FROM_EMAIL: str = Field(default="", description="From email address")
-    RECIPIENT_EMAILS: str = Field(default="", description="Comma-separated recipient emails")
+    EMAIL_ENABLED: bool = False  # Enable email notifications
+    SMTP_HOST: str = ""  # SMTP server host
+    SMTP_PORT: int = 587  # SMTP server port
+    SMTP_USER: str = ""  # SMTP username/email
+    SMTP_PASSWORD: str = ""  # SMTP password/app password
+    SMTP_USE_TLS: bool = True  # Use TLS for SMTP
+    FROM_EMAIL: str = ""  # From email address
+    # Comma-separated recipient emails
+    RECIPIENT_EMAILS: Annotated[Tuple[str, ...], NoDecode] = ()
     
     # ==================== PROCESSING ====================
-    DELETE_INCOMING_AFTER_PROCESSING: bool = Field(
-        default=False,
-        description="Delete ZIP from incoming/ after successful processing"
-    )
-    MAX_RECORDS_PER_BATCH: int = Field(
-        default=1000,
-        description="Maximum records to insert in single DB transaction"
-    )
-    ENABLE_DATA_VALIDATION: bool = Field(
-        default=True,
-        description="Enable data quality validation"
-    )
+    DELETE_INCOMING_AFTER_PROCESSING: bool = False  # Delete ZIP from incoming/ after successful processing
+    MAX_RECORDS_PER_BATCH: int = 1000  # Maximum records to insert in single DB transaction
+    ENABLE_DATA_VALIDATION: bool = True  # Enable data quality validation
     
     # ==================== CORS ====================
-    CORS_ORIGINS: str = Field(
-        default="http://localhost:3000,http://localhost:8000",
-        description="Comma-separated CORS origins"
-    )
+    # Comma-separated CORS origins
+    CORS_ORIGINS: Annotated[Tuple[str, ...], NoDecode] = _DEFAULT_CORS_ORIGINS
     
     # ==================== RETRY LOGIC ====================
-    MAX_RETRIES: int = Field(default=3, description="Max retries for failed operations")
-    RETRY_DELAY_SECONDS: int = Field(default=5, description="Delay between retries in seconds")
+    MAX_RETRIES: int = 3  # Max retries for failed operations
+    RETRY_DELAY_SECONDS: int = 5  # Delay between retries in seconds
     
     # ==================== LINKEDIN SPECIFIC ====================
-    EXPECTED_TABLES: str = Field(
-        default="participants,conversations,messages,connections,profile,reactions",
-        description="Comma-separated expected table names in LinkedIn export"
-    )
+    # Comma-separated expected table names in LinkedIn export
+    EXPECTED_TABLES: Annotated[Tuple[str, ...], NoDecode] = _DEFAULT_EXPECTED_TABLES
+    
+    @field_validator('RECIPIENT_EMAILS', 'CORS_ORIGINS', 'EXPECTED_TABLES', mode='before')
+    @classmethod
+    def parse_csv_list(cls, v, info: ValidationInfo):
+        """Parse comma-separated env values once at load time (lists pass through)."""
+        if isinstance(v, str):
+            v = _split_csv(v)
+        if not v:
+            # Empty CORS/table settings fall back to the defaults
+            return _CSV_FALLBACKS.get(info.field_name, ())
+        return tuple(v)
     
     model_config = {
         "env_file": ".env",
         "env_file_encoding": "utf-8",
         "case_sensitive": False,
-        "extra": "ignore"
+        "extra": "ignore",
+        "frozen": True  # Loaded once and shared across threads; never mutated
     }
     
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> tuple[PydanticBaseSettingsSource, ...]:
+        """Load from init kwargs, environment and .env only (no secrets dir)."""
+        return init_settings, env_settings, dotenv_settings
+    
+    @classmethod
+    def from_cache(cls, data: dict) -> "Settings":
+        """
+        Rebuild settings from an already-validated dump without re-validating.
+        
+        Intended for values produced by settings.model_dump() in the same
+        deployment (e.g. handed to a worker process); no environment or .env
+        lookup and no validators run.
+        
+        Args:
+            data: Field values from a previously validated Settings instance
+            
+        Returns:
+            Settings instance
+        """
+        return cls.model_construct(**data)
+    
     # ==================== COMPUTED PROPERTIES ====================
+    # Cached: settings are not changed after load, so each value is parsed once
     
-    @property
-    def recipient_emails_list(self) -> List[str]:
-        """Parse RECIPIENT_EMAILS into list."""
-        if not self.RECIPIENT_EMAILS:
-            return []
-        return [email.strip() for email in self.RECIPIENT_EMAILS.split(',') if email.strip()]
-    
-    @property
-    def cors_origins_list(self) -> List[str]:
-        """Parse CORS_ORIGINS into list."""
-        if not self.CORS_ORIGINS:
-            return ["http://localhost:3000", "http://localhost:8000"]
-        return [origin.strip() for origin in self.CORS_ORIGINS.split(',') if origin.strip()]
-    
-    @property
-    def expected_tables_list(self) -> List[str]:
-        """Parse EXPECTED_TABLES into list."""
-        if not self.EXPECTED_TABLES:
-            return ["participants", "conversations", "messages", "connections", "profile", "reactions"]
-        return [table.strip() for table in self.EXPECTED_TABLES.split(',') if table.strip()]
+    @cached_property
+    def expected_tables_set(self) -> FrozenSet[str]:
+        """EXPECTED_TABLES as a set, for membership tests."""
+        return frozenset(self.EXPECTED_TABLES)
+    
+    @cached_property
+    def _tz(self):
+        """Resolved timezone object for TIMEZONE."""
+        return _tz_cached(self.TIMEZONE)
     
     # ==================== UTILITY METHODS ====================
     
     def get_current_timestamp(self) -> str:
         """Get current timestamp in configured timezone."""
-        tz = pytz.timezone(self.TIMEZONE)
-        return datetime.now(tz).isoformat()
+        return datetime.now(self._tz).isoformat()
     
     def get_schedule_description(self) -> str:
         """Get human-readable schedule description."""
-        day_names = {
-            'mon': 'Monday',
-            'tue': 'Tuesday',
-            'wed': 'Wednesday',
-            'thu': 'Thursday',
-            'fri': 'Friday',
-            'sat': 'Saturday',
-            'sun': 'Sunday'
-        }
-        day = day_names.get(self.SCHEDULE_DAY_OF_WEEK, self.SCHEDULE_DAY_OF_WEEK)
+        day = _DAY_NAMES.get(self.SCHEDULE_DAY_OF_WEEK, self.SCHEDULE_DAY_OF_WEEK)
         return f"Every {day} at {self.SCHEDULE_HOUR:02d}:{self.SCHEDULE_MINUTE:02d} {self.TIMEZONE}"
     
     def ensure_directories(self):
-        """Create all required directories if they don't exist."""
-        directories = [
-            self.incoming_path,
-            self.raw_zip_path,
-            self.out_zip_path,
-            Path(self.LOG_FILE).parent
-        ]
+        """Create all required directories if they don't exist (once per process)."""
+        global _dirs_ready
+        if _dirs_ready:
+            return
         
-        for directory in directories:
-            directory.mkdir(parents=True, exist_ok=True)
+        with _dirs_lock:
+            if _dirs_ready:
+                return
+            
+            directories = [
+                self.incoming_path,
+                self.raw_zip_path,
+                self.out_zip_path,
+                Path(self.LOG_FILE).parent
+            ]
+            
+            for directory in directories:
+                # isdir is a single stat; skip makedirs for existing directories
+                if not os.path.isdir(directory):
+                    os.makedirs(directory, exist_ok=True)
+            
+            _dirs_ready = True
     
     def validate_email_config(self) -> tuple[bool, Optional[str]]:
         """
@@ -190,37 +257,42 @@ class Settings(BaseSettings):
         Returns:
             Tuple of (is_valid, error_message)
         """
+        return self._email_config_status
+    
+    @cached_property
+    def _email_config_status(self) -> tuple[bool, Optional[str]]:
+        """Email configuration verdict, computed once."""
         if not self.EMAIL_ENABLED:
             return True, None
         
-        required_fields = {
-            "SMTP_HOST": self.SMTP_HOST,
-            "SMTP_USER": self.SMTP_USER,
-            "SMTP_PASSWORD": self.SMTP_PASSWORD,
-            "FROM_EMAIL": self.FROM_EMAIL,
-        }
-        
-        missing = [key for key, value in required_fields.items() if not value]
+        missing = [key for key in _EMAIL_REQUIRED if not getattr(self, key)]
         
         if missing:
             return False, f"Missing required email configuration: {', '.join(missing)}"
         
-        if not self.recipient_emails_list:
+        if not self.RECIPIENT_EMAILS:
             return False, "No recipient emails configured (RECIPIENT_EMAILS)"
         
         return True, None
     
-    def get_database_type(self) -> str:
-        """Get database type from connection URL."""
-        if self.DATABASE_URL.startswith("sqlite"):
+    @cached_property
+    def _database_type(self) -> str:
+        """Database type derived once from DATABASE_URL."""
+        url = self.DATABASE_URL
+        if url.startswith("sqlite"):
             return "sqlite"
-        elif self.DATABASE_URL.startswith("postgresql"):
+        elif url.startswith("postgresql"):
             return "postgresql"
         else:
             return "unknown"
     
-    def __repr__(self) -> str:
-        """String representation (without sensitive data)."""
+    def get_database_type(self) -> str:
+        """Get database type from connection URL."""
+        return self._database_type
+    
+    @cached_property
+    def _repr(self) -> str:
+        """Representation string, built once (settings don't change after load)."""
         return (
             f"Settings(APP_NAME='{self.APP_NAME}', "
             f"DEBUG={self.DEBUG}, "
@@ -228,9 +300,26 @@ class Settings(BaseSettings):
             f"EMAIL_ENABLED={self.EMAIL_ENABLED}, "
             f"SCHEDULER_ENABLED={self.SCHEDULER_ENABLED})"
         )
+    
+    def __repr__(self) -> str:
+        """String representation (without sensitive data)."""
+        return self._repr
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Load settings on first use and return the shared instance.
+    
+    Parsing .env and creating directories happens here rather than at
+    import time, so modules can import app.config without that cost.
+    """
+    loaded = Settings()
+    loaded.ensure_directories()
+    return loaded
 
-# Singleton instance
-settings = Settings()
 
-# Ensure directories exist on import
-settings.ensure_directories()
\ No newline at end of file
+def __getattr__(name: str):
+    """Resolve the legacy module-level `settings` singleton lazily (PEP 562)."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
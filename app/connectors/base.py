@@ -7,7 +7,7 @@ Defines the contract that all data connectors must implement.
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 
 
 class BaseConnector(ABC):
@@ -75,32 +75,28 @@ class BaseConnector(ABC):
             True if valid, False otherwise
         """
         # Default validation: check data is non-empty dict of lists
-        if not isinstance(data, dict):
+        if not isinstance(data, dict) or not data:
             return False
         
-        if not data:
-            return False
-        
-        for table_name, records in data.items():
-            if not isinstance(records, list):
-                return False
-        
-        return True
+        # Exact type check: extract() always builds plain lists
+        return all(type(records) is list for records in data.values())
     
-    def get_metadata(self, source_path: Path) -> Dict[str, Any]:
+    def get_metadata(self, source_path: Path, check_exists: bool = True) -> Dict[str, Any]:
         """
         Get metadata about the data source (optional override).
         
         Args:
             source_path: Path to data source
+            check_exists: Stat the source to fill in "exists"; pass False to
+                skip the filesystem call when only the path is needed
             
         Returns:
             Metadata dictionary
         """
-        return {
-            "source_path": str(source_path),
-            "exists": source_path.exists()
-        }
+        metadata: Dict[str, Any] = {"source_path": str(source_path)}
+        if check_exists:
+            metadata["exists"] = source_path.exists()
+        return metadata
 
 
 class ConnectorRegistry:
@@ -110,9 +106,12 @@ class ConnectorRegistry:
     Allows registration and retrieval of connectors by name.
     """
     
+    __slots__ = ("_connectors", "_names_cache")
+    
     def __init__(self):
         """Initialize empty connector registry."""
         self._connectors: Dict[str, BaseConnector] = {}
+        self._names_cache: Optional[List[str]] = None
     
     def register(self, name: str, connector: BaseConnector) -> None:
         """
@@ -123,6 +122,7 @@ class ConnectorRegistry:
             connector: Connector instance
         """
         self._connectors[name] = connector
+        self._names_cache = None
     
     def get(self, name: str) -> BaseConnector:
         """
@@ -137,18 +137,23 @@ class ConnectorRegistry:
         Raises:
             KeyError: If connector not registered
         """
-        if name not in self._connectors:
+        connector = self._connectors.get(name)
+        if connector is None:
             raise KeyError(f"Connector '{name}' not registered")
-        return self._connectors[name]
+        return connector
     
     def list_connectors(self) -> List[str]:
         """
         List all registered connector names.
         
+        The list is cached until the next registration; treat it as read-only.
+        
         Returns:
             List of connector names
         """
-        return list(self._connectors.keys())
+        if self._names_cache is None:
+            self._names_cache = list(self._connectors)
+        return self._names_cache
     
     def has_connector(self, name: str) -> bool:
         """
@@ -6,17 +6,72 @@ Extracts and parses CSV files from the export into standardized dictionaries.
 """
 
 import csv
+import mmap
+import operator
+import re
+import sys
 import zipfile
-import json
-from pathlib import Path
-from typing import Dict, List, Any, Optional
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path, PurePosixPath
+from typing import Dict, List, Any, Optional, TextIO, BinaryIO, Iterator
 import logging
 import io
 
 from app.connectors.base import BaseConnector
 
+# Optional: pyarrow's vectorized CSV reader (falls back to the csv module)
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+except ImportError:  # pragma: no cover - depends on environment
+    pa = pc = pa_csv = None
+
 logger = logging.getLogger(__name__)
 
+# "Name <email>" -> group 1: text before the first '<', group 2: text after it
+# up to the next '<' or '>'
+_PARTICIPANT_RE = re.compile(r'^([^<]*)<([^<>]*)')
+
+# Recipient lists may be comma- or semicolon-separated (or a mix)
+_RECIPIENT_SPLIT_RE = re.compile(r'[,;]')
+
+
+class _MappedFile(mmap.mmap):
+    """Read-only mmap that ZipFile can treat as a seekable file object."""
+    
+    def seekable(self) -> bool:
+        # mmap only grows seekable() in Python 3.13; ZipFile probes for it
+        return True
+
+
+@contextmanager
+def _open_zip(source_path: Path) -> Iterator[zipfile.ZipFile]:
+    """
+    Open a ZIP archive backed by a read-only memory map of the file.
+    
+    Entries are paged in by the OS on demand rather than copied through
+    buffered reads of the file object.
+    
+    Args:
+        source_path: Path to the ZIP file
+        
+    Yields:
+        Open ZipFile object
+        
+    Raises:
+        zipfile.BadZipFile: If the file is empty or not a valid ZIP
+    """
+    with open(source_path, 'rb') as f:
+        # mmap can't map a zero-length file; report it the way ZipFile would
+        if not f.seek(0, io.SEEK_END):
+            raise zipfile.BadZipFile("File is not a zip file")
+        with _MappedFile(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with zipfile.ZipFile(mm, 'r') as zip_ref:
+                yield zip_ref
+
 
 class DataExportConnector(BaseConnector):
     """
@@ -37,6 +92,20 @@ class DataExportConnector(BaseConnector):
         'registrations': 'Registration.csv',
     }
     
+    # Column aliases for messages.csv (LinkedIn field names vary between exports);
+    # the first alias present in the file wins
+    MESSAGE_COLUMN_ALIASES = {
+        'from': ('FROM', 'From', 'SENDER'),
+        'to': ('TO', 'To', 'RECIPIENTS'),
+        'date': ('DATE', 'Date', 'SENT AT'),
+        'subject': ('SUBJECT', 'Subject', 'CONVERSATION TITLE'),
+        'content': ('CONTENT', 'Content', 'MESSAGE'),
+        'folder': ('FOLDER', 'Folder'),
+    }
+    
+    # Threads used to parse the expected files concurrently in extract()
+    EXTRACT_WORKERS = 4
+    
     def __init__(self):
         """Initialize the data export connector."""
         self.temp_extract_dir = None
@@ -64,30 +133,43 @@ class DataExportConnector(BaseConnector):
         raw_data = {}
         
         try:
-            with zipfile.ZipFile(source_path, 'r') as zip_ref:
+            with _open_zip(source_path) as zip_ref:
                 # List all files in ZIP for debugging
                 file_list = zip_ref.namelist()
                 logger.debug(f"Files in ZIP: {len(file_list)}")
+                name_index = self._build_name_index(file_list)
+            
+            # Extract each expected file type in parallel (decompression and
+            # pyarrow parsing release the GIL); each task opens its own ZipFile
+            # since one isn't safe to share between threads
+            with ThreadPoolExecutor(
+                max_workers=self.EXTRACT_WORKERS,
+                thread_name_prefix="extract"
+            ) as pool:
+                futures = {
+                    data_type: pool.submit(self._extract_file, source_path, filename, name_index)
+                    for data_type, filename in self.FILE_MAPPINGS.items()
+                }
                 
-                # Extract each expected file type
+                # Collect in FILE_MAPPINGS order so raw_data/logging stay deterministic
                 for data_type, filename in self.FILE_MAPPINGS.items():
-                    records = self._extract_file_from_zip(zip_ref, filename, file_list)
+                    records = futures[data_type].result()
                     if records:
                         raw_data[data_type] = records
                         logger.info(f"Extracted {len(records)} records from {filename}")
                     else:
                         logger.warning(f"No data found for {filename}")
-                
-                # Special handling for messages (may have conversation structure)
-                if 'messages' in raw_data:
-                    raw_data = self._parse_messages(raw_data)
-                
-                if not raw_data:
-                    raise ValueError("No valid LinkedIn data found in ZIP file")
-                
-                logger.info(f"Successfully extracted {sum(len(r) for r in raw_data.values())} total records")
-                
-                return raw_data
+            
+            # Special handling for messages (may have conversation structure)
+            if 'messages' in raw_data:
+                raw_data = self._parse_messages(raw_data)
+            
+            if not raw_data:
+                raise ValueError("No valid LinkedIn data found in ZIP file")
+            
+            logger.info(f"Successfully extracted {sum(len(r) for r in raw_data.values())} total records")
+            
+            return raw_data
                 
         except zipfile.BadZipFile as e:
             logger.error(f"Invalid ZIP file: {e}")
@@ -96,11 +178,55 @@ class DataExportConnector(BaseConnector):
             logger.error(f"Failed to extract LinkedIn export: {e}", exc_info=True)
             raise
     
+    @staticmethod
+    def _build_name_index(file_list: List[str]) -> Dict[str, str]:
+        """
+        Index ZIP entries by lower-cased base name.
+        
+        Lookups are case-insensitive and ignore nested directories; when
+        several entries share a name, the first one in the ZIP wins.
+        
+        Args:
+            file_list: List of all files in ZIP
+            
+        Returns:
+            Dict mapping lower-cased file name to full entry path
+        """
+        name_index: Dict[str, str] = {}
+        for file_path in file_list:
+            # ZIP entries always use '/' separators
+            name_index.setdefault(PurePosixPath(file_path).name.lower(), file_path)
+        return name_index
+    
+    def _extract_file(
+        self,
+        source_path: Path,
+        target_filename: str,
+        name_index: Dict[str, str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Worker-thread wrapper around _extract_file_from_zip with a private ZipFile.
+        
+        Args:
+            source_path: Path to LinkedIn export ZIP file
+            target_filename: Name of file to extract (e.g., 'messages.csv')
+            name_index: Entry index from _build_name_index()
+            
+        Returns:
+            List of record dictionaries
+        """
+        if target_filename.lower() not in name_index:
+            logger.debug(f"File not found in ZIP: {target_filename}")
+            return []
+        
+        with _open_zip(source_path) as zip_ref:
+            return self._extract_file_from_zip(zip_ref, target_filename, name_index)
+    
     def _extract_file_from_zip(
         self,
         zip_ref: zipfile.ZipFile,
         target_filename: str,
-        file_list: List[str]
+        name_index: Dict[str, str]
     ) -> List[Dict[str, Any]]:
         """
         Extract and parse a specific file from the ZIP.
@@ -108,77 +234,153 @@ class DataExportConnector(BaseConnector):
         Args:
             zip_ref: Open ZipFile object
             target_filename: Name of file to extract (e.g., 'messages.csv')
-            file_list: List of all files in ZIP
+            name_index: Entry index from _build_name_index()
             
         Returns:
             List of record dictionaries
         """
         # Find file in ZIP (case-insensitive, handles nested directories)
-        matching_file = None
-        for file_path in file_list:
-            file_name = Path(file_path).name
-            if file_name.lower() == target_filename.lower():
-                matching_file = file_path
-                break
+        matching_file = name_index.get(target_filename.lower())
         
         if not matching_file:
             logger.debug(f"File not found in ZIP: {target_filename}")
             return []
         
         try:
-            # Read file content
-            with zip_ref.open(matching_file) as file:
-                content = file.read()
-                
-                # Determine file type and parse accordingly
-                if matching_file.lower().endswith('.csv'):
-                    return self._parse_csv(content)
-                elif matching_file.lower().endswith('.json'):
-                    return self._parse_json(content)
-                else:
-                    logger.warning(f"Unknown file type: {matching_file}")
-                    return []
+            # Determine file type and parse accordingly
+            if matching_file.lower().endswith('.csv'):
+                return self._parse_csv_entry(zip_ref, matching_file)
+            elif matching_file.lower().endswith('.json'):
+                with zip_ref.open(matching_file) as file:
+                    return self._parse_json(file.read())
+            else:
+                logger.warning(f"Unknown file type: {matching_file}")
+                return []
                     
         except Exception as e:
             logger.error(f"Failed to parse {matching_file}: {e}")
             return []
     
-    def _parse_csv(self, content: bytes) -> List[Dict[str, Any]]:
+    def _parse_csv_entry(self, zip_ref: zipfile.ZipFile, member: str) -> List[Dict[str, Any]]:
         """
-        Parse CSV content into list of dictionaries.
+        Stream-parse a CSV member of the ZIP without reading it into memory.
         
         Args:
-            content: Raw CSV file content as bytes
+            zip_ref: Open ZipFile object
+            member: Name of the CSV file inside the ZIP
             
         Returns:
             List of record dictionaries
         """
-        try:
-            # Decode content (try UTF-8, fallback to latin-1)
-            try:
-                text_content = content.decode('utf-8')
-            except UnicodeDecodeError:
-                text_content = content.decode('latin-1')
-            
-            # Parse CSV
-            csv_file = io.StringIO(text_content)
-            reader = csv.DictReader(csv_file)
-            
-            records = []
-            for row in reader:
-                # Clean up row: strip whitespace from keys and values
-                cleaned_row = {
-                    key.strip(): value.strip() if isinstance(value, str) else value
-                    for key, value in row.items()
-                }
-                records.append(cleaned_row)
+        if pa_csv is not None:
+            with zip_ref.open(member) as raw:
+                records = self._parse_csv_arrow(raw)
+            if records is not None:
+                return records
+        
+        # Decode while streaming in one pass; LinkedIn exports are UTF-8, so
+        # stray bad bytes become U+FFFD instead of restarting the whole file
+        with zip_ref.open(member) as raw:
+            text_stream = io.TextIOWrapper(raw, encoding='utf-8', errors='replace', newline='')
+            return self._parse_csv(text_stream)
+    
+    def _parse_csv(self, text_stream: TextIO) -> List[Dict[str, Any]]:
+        """
+        Parse CSV text into list of dictionaries.
+        
+        Args:
+            text_stream: Text stream positioned at the CSV header
             
-            return records
+        Returns:
+            List of record dictionaries
+        """
+        try:
+            return list(self._iter_csv(text_stream))
             
         except Exception as e:
             logger.error(f"Failed to parse CSV: {e}")
             return []
     
+    @staticmethod
+    def _iter_csv(text_stream: TextIO) -> Iterator[Dict[str, Any]]:
+        """
+        Yield CSV rows as dictionaries keyed by the (stripped) header.
+        
+        Args:
+            text_stream: Text stream positioned at the CSV header
+            
+        Yields:
+            Record dictionaries
+            
+        Raises:
+            ValueError: If a row has more fields than the header
+        """
+        # Parse CSV positionally; the header is cleaned once up front
+        reader = csv.reader(text_stream)
+        header = next(reader, None)
+        if not header:
+            return
+        
+        columns = tuple(name.strip() for name in header)
+        width = len(columns)
+        padding = (None,) * width
+        strip = str.strip
+        
+        for row in reader:
+            if not row:
+                continue
+            if len(row) == width:
+                yield dict(zip(columns, map(strip, row)))
+            elif len(row) < width:
+                # Short rows get None for missing fields, like DictReader
+                values = (*map(strip, row), *padding[len(row):])
+                yield dict(zip(columns, values))
+            else:
+                raise ValueError(f"row has {len(row)} fields, header has {width}")
+    
+    def _parse_csv_arrow(self, raw: BinaryIO) -> Optional[List[Dict[str, Any]]]:
+        """
+        Parse UTF-8 CSV content with pyarrow's multithreaded reader.
+        
+        All columns are read as strings and whitespace is trimmed column-wise,
+        matching the csv module path. Returns None when the content isn't
+        something this path handles (non UTF-8, ragged rows) so the caller
+        can fall back.
+        
+        Args:
+            raw: Binary stream positioned at the CSV header
+            
+        Returns:
+            List of record dictionaries, or None to use the fallback parser
+        """
+        try:
+            header_line = raw.readline().decode('utf-8')
+            header = next(csv.reader([header_line]), [])
+            if not header:
+                return []
+            
+            column_names = [name.strip() for name in header]
+            table = pa_csv.read_csv(
+                raw,
+                read_options=pa_csv.ReadOptions(column_names=column_names),
+                # Message CONTENT can span lines; without this pyarrow splits
+                # blocks at any newline, even inside a quoted value
+                parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+                convert_options=pa_csv.ConvertOptions(
+                    column_types={name: pa.string() for name in column_names},
+                    strings_can_be_null=False
+                )
+            )
+            table = pa.table(
+                [pc.utf8_trim_whitespace(column) for column in table.columns],
+                names=column_names
+            )
+            return table.to_pylist()
+            
+        except Exception as e:
+            logger.debug(f"pyarrow CSV parse not applicable, falling back: {e}")
+            return None
+    
     def _parse_json(self, content: bytes) -> List[Dict[str, Any]]:
         """
         Parse JSON content into list of dictionaries.
@@ -190,8 +392,8 @@ class DataExportConnector(BaseConnector):
             List of record dictionaries
         """
         try:
-            text_content = content.decode('utf-8')
-            data = json.loads(text_content)
+            # orjson validates UTF-8 and parses straight from bytes
+            data = orjson.loads(content)
             
             # Handle different JSON structures
             if isinstance(data, list):
@@ -240,70 +442,82 @@ class DataExportConnector(BaseConnector):
         messages = raw_data['messages']
         
         # Track unique participants and conversations
-        participants_map = {}  # email/name -> participant dict
-        conversations_map = {}  # conversation_id -> conversation dict
+        participants_map = {}  # name -> participant_id
+        participants_data = []  # (name, first_seen) in participant_id order
+        conversations_map = {}  # (subject, participants) -> conversation dict
+        signatures = {}  # (from, to) raw fields -> (sender, sorted participants)
         parsed_messages = []
         
-        participant_id_counter = 1
-        conversation_id_counter = 1
         message_id_counter = 1
         
-        for msg in messages:
+        # Folder and participant names repeat across thousands of rows; share
+        # one str object per distinct value
+        intern = sys.intern
+        
+        # Resolve column aliases once per file (all CSV rows share the header)
+        columns = messages[0].keys() if messages else ()
+        get_from = self._column_getter(columns, 'from', '')
+        get_to = self._column_getter(columns, 'to', '')
+        get_date = self._column_getter(columns, 'date', '')
+        get_subject = self._column_getter(columns, 'subject', '')
+        get_content = self._column_getter(columns, 'content', '')
+        get_folder = self._column_getter(columns, 'folder', 'UNKNOWN')
+        
+        # Consume raw rows as they're parsed so they don't stay alive next to
+        # the parsed output (reversed once so pop() from the end keeps order)
+        messages.reverse()
+        while messages:
+            msg = messages.pop()
             # Extract fields (LinkedIn CSV field names may vary)
-            from_field = msg.get('FROM', msg.get('From', msg.get('SENDER', '')))
-            to_field = msg.get('TO', msg.get('To', msg.get('RECIPIENTS', '')))
-            date_field = msg.get('DATE', msg.get('Date', msg.get('SENT AT', '')))
-            subject_field = msg.get('SUBJECT', msg.get('Subject', msg.get('CONVERSATION TITLE', '')))
-            content_field = msg.get('CONTENT', msg.get('Content', msg.get('MESSAGE', '')))
-            folder = msg.get('FOLDER', msg.get('Folder', 'UNKNOWN'))
-            
-            # Parse participants
-            sender = self._extract_participant(from_field)
-            recipients = self._extract_recipients(to_field)
-            
-            # Add sender to participants
-            if sender and sender not in participants_map:
-                participants_map[sender] = {
-                    'participant_id': participant_id_counter,
-                    'name': sender,
-                    'email': self._extract_email(sender),
-                    'first_seen': date_field
-                }
-                participant_id_counter += 1
-            
-            # Add recipients to participants
-            for recipient in recipients:
-                if recipient and recipient not in participants_map:
-                    participants_map[recipient] = {
-                        'participant_id': participant_id_counter,
-                        'name': recipient,
-                        'email': self._extract_email(recipient),
-                        'first_seen': date_field
-                    }
-                    participant_id_counter += 1
+            from_field = get_from(msg)
+            to_field = get_to(msg)
+            date_field = get_date(msg)
+            subject_field = get_subject(msg)
+            content_field = get_content(msg)
+            folder = get_folder(msg)
+            if isinstance(folder, str):
+                folder = intern(folder)
+            
+            # Parse participants once per distinct FROM/TO pair; repeat pairs
+            # (the bulk of any thread) were already registered the first time
+            signature = signatures.get((from_field, to_field))
+            if signature is None:
+                sender = intern(self._extract_participant(from_field))
+                recipients = [intern(recipient) for recipient in self._extract_recipients(to_field)]
+                
+                # Add sender and recipients to participants (ids assigned on first sight)
+                for name in (sender, *recipients):
+                    if name:
+                        known = len(participants_map)
+                        if participants_map.setdefault(name, known + 1) > known:
+                            participants_data.append((name, date_field))
+                
+                signature = signatures[(from_field, to_field)] = (
+                    sender, tuple(sorted([sender] + recipients))
+                )
+            sender, all_participants = signature
             
             # Create conversation identifier (based on subject + participants)
-            all_participants = sorted([sender] + recipients)
-            conversation_key = f"{subject_field}:{':'.join(all_participants)}"
+            conversation_key = (subject_field, all_participants)
             
-            if conversation_key not in conversations_map:
-                conversations_map[conversation_key] = {
-                    'conversation_id': conversation_id_counter,
+            conversation = conversations_map.get(conversation_key)
+            if conversation is None:
+                conversation = conversations_map[conversation_key] = {
+                    'conversation_id': len(conversations_map) + 1,
                     'subject': subject_field or '(No Subject)',
-                    'participant_ids': [participants_map[p]['participant_id'] for p in all_participants if p in participants_map],
+                    'participant_ids': [participants_map[p] for p in all_participants if p in participants_map],
                     'created_at': date_field,
                     'message_count': 0
                 }
-                conversation_id_counter += 1
             
             # Increment message count
-            conversations_map[conversation_key]['message_count'] += 1
+            conversation['message_count'] += 1
             
             # Create message record
             parsed_messages.append({
                 'message_id': message_id_counter,
-                'conversation_id': conversations_map[conversation_key]['conversation_id'],
-                'sender_id': participants_map.get(sender, {}).get('participant_id'),
+                'conversation_id': conversation['conversation_id'],
+                'sender_id': participants_map.get(sender),
                 'sender_name': sender,
                 'content': content_field,
                 'sent_at': date_field,
@@ -312,7 +526,15 @@ class DataExportConnector(BaseConnector):
             message_id_counter += 1
         
         # Update raw_data with parsed structures
-        raw_data['participants'] = list(participants_map.values())
+        raw_data['participants'] = [
+            {
+                'participant_id': participant_id,
+                'name': name,
+                'email': self._extract_email(name),
+                'first_seen': first_seen
+            }
+            for participant_id, (name, first_seen) in enumerate(participants_data, start=1)
+        ]
         raw_data['conversations'] = list(conversations_map.values())
         raw_data['messages'] = parsed_messages
         
@@ -322,6 +544,23 @@ class DataExportConnector(BaseConnector):
         
         return raw_data
     
+    def _column_getter(self, columns, field: str, default: str):
+        """
+        Build a row accessor for a logical messages.csv field.
+        
+        Args:
+            columns: Column names present in the file
+            field: Key into MESSAGE_COLUMN_ALIASES
+            default: Value returned when none of the aliases is present
+            
+        Returns:
+            Callable taking a row dict and returning the field value
+        """
+        for alias in self.MESSAGE_COLUMN_ALIASES[field]:
+            if alias in columns:
+                return operator.itemgetter(alias)
+        return lambda row: default
+    
     def _extract_participant(self, participant_field: str) -> str:
         """
         Extract participant name/identifier from field.
@@ -336,8 +575,9 @@ class DataExportConnector(BaseConnector):
             return ""
         
         # Remove email brackets if present: "John Doe <john@example.com>" -> "John Doe"
-        if '<' in participant_field and '>' in participant_field:
-            return participant_field.split('<')[0].strip()
+        match = _PARTICIPANT_RE.match(participant_field)
+        if match and '>' in participant_field:
+            return match.group(1).strip()
         
         return participant_field.strip()
     
@@ -345,7 +585,7 @@ class DataExportConnector(BaseConnector):
         """
         Extract list of recipients from field.
         
-        Recipients may be comma-separated or semicolon-separated.
+        Recipients may be comma-separated, semicolon-separated, or a mix.
         
         Args:
             recipients_field: Raw recipients string
@@ -357,14 +597,13 @@ class DataExportConnector(BaseConnector):
             return []
         
         # Split by comma or semicolon
-        separators = [',', ';']
-        for sep in separators:
-            if sep in recipients_field:
-                recipients = [self._extract_participant(r.strip()) for r in recipients_field.split(sep)]
-                return [r for r in recipients if r]
-        
-        # Single recipient
-        return [self._extract_participant(recipients_field)]
+        parts = _RECIPIENT_SPLIT_RE.split(recipients_field)
+        if len(parts) == 1:
+            # Single recipient
+            return [self._extract_participant(recipients_field)]
+        
+        recipients = [self._extract_participant(r.strip()) for r in parts]
+        return [r for r in recipients if r]
     
     def _extract_email(self, participant_string: str) -> Optional[str]:
         """
@@ -380,8 +619,9 @@ class DataExportConnector(BaseConnector):
             return None
         
         # Check for email in brackets: "Name <email@example.com>"
-        if '<' in participant_string and '>' in participant_string:
-            email = participant_string.split('<')[1].split('>')[0].strip()
+        match = _PARTICIPANT_RE.match(participant_string)
+        if match and '>' in participant_string:
+            email = match.group(2).strip()
             return email if '@' in email else None
         
         # Check if the whole string is an email
@@ -439,25 +679,26 @@ class DataExportConnector(BaseConnector):
         Returns:
             Metadata dictionary
         """
+        stat = source_path.stat()
         metadata = {
             'file_name': source_path.name,
-            'file_size_mb': source_path.stat().st_size / (1024 * 1024),
+            'file_size_mb': stat.st_size / (1024 * 1024),
             'files_in_zip': [],
             'detected_tables': []
         }
         
         try:
-            with zipfile.ZipFile(source_path, 'r') as zip_ref:
+            with _open_zip(source_path) as zip_ref:
                 file_list = zip_ref.namelist()
                 metadata['files_in_zip'] = file_list
                 metadata['file_count'] = len(file_list)
                 
                 # Detect which expected files are present
-                for data_type, filename in self.FILE_MAPPINGS.items():
-                    for file_path in file_list:
-                        if Path(file_path).name.lower() == filename.lower():
-                            metadata['detected_tables'].append(data_type)
-                            break
+                name_index = self._build_name_index(file_list)
+                metadata['detected_tables'] = [
+                    data_type for data_type, filename in self.FILE_MAPPINGS.items()
+                    if filename.lower() in name_index
+                ]
         
         except Exception as e:
             logger.error(f"Failed to get metadata: {e}")
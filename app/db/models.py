@@ -4,16 +4,45 @@ SQLAlchemy ORM models matching schema.sql
 Maps database tables to Python objects for type-safe operations
 """
 
-from datetime import datetime
-from typing import Optional, List
+import enum
+from typing import Any, Dict, Iterable, Optional, List
 from sqlalchemy import (
     Boolean, Column, Integer, String, Text, DateTime, ForeignKey, 
-    UniqueConstraint, Index, event
+    UniqueConstraint, Index, Enum, event, insert
 )
-from sqlalchemy.orm import declarative_base, relationship, Session
+from sqlalchemy.orm import declarative_base, relationship, sessionmaker, Session
 from sqlalchemy.sql import func
 
-Base = declarative_base()
+
+class BulkInsertMixin:
+    """Core-level bulk insert shared by every model"""
+    
+    BULK_INSERT_BATCH_SIZE = 10_000
+    
+    @classmethod
+    def bulk_insert(cls, session: Session, rows: Iterable[Dict[str, Any]]) -> int:
+        """
+        Insert plain column dicts with executemany, bypassing the ORM unit of work
+        (no object construction, identity map or change tracking).
+        
+        Rows are sent in batches of BULK_INSERT_BATCH_SIZE within the session's
+        current transaction; committing stays with the caller.
+        
+        Args:
+            session: Active database session
+            rows: Dicts keyed by column name
+        
+        Returns:
+            Number of rows inserted
+        """
+        rows = list(rows)
+        statement = insert(cls.__table__)
+        for start in range(0, len(rows), cls.BULK_INSERT_BATCH_SIZE):
+            session.execute(statement, rows[start:start + cls.BULK_INSERT_BATCH_SIZE])
+        return len(rows)
+
+
+Base = declarative_base(cls=BulkInsertMixin)
 
 
 # ============================================================================
@@ -30,8 +59,8 @@ class Participant(Base):
     profile_url = Column(String, nullable=True)
     email = Column(String, nullable=True)
     headline = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=func.now(), nullable=False)
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=False)
+    created_at = Column(DateTime, default=func.now(), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime, default=func.now(), server_default=func.now(), onupdate=func.now(), nullable=False)
     
     # Relationships
     sent_messages = relationship("Message", back_populates="sender", cascade="all, delete-orphan")
@@ -50,8 +79,8 @@ class Conversation(Base):
     conversation_id = Column(String, unique=True, nullable=False, index=True)
     conversation_title = Column(String, nullable=True)
     is_group_chat = Column(Boolean, default=False, nullable=False)
-    created_at = Column(DateTime, default=func.now(), nullable=False)
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=False)
+    created_at = Column(DateTime, default=func.now(), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime, default=func.now(), server_default=func.now(), onupdate=func.now(), nullable=False)
     first_message_at = Column(DateTime, nullable=True)
     last_message_at = Column(DateTime, nullable=True, index=True)
     
@@ -66,15 +95,21 @@ class Conversation(Base):
 class Message(Base):
     """Individual message within a conversation"""
     __tablename__ = "messages"
+    __table_args__ = (
+        # Timeline lookups (per conversation / per sender, ordered by time);
+        # these also serve plain conversation_id / sender_id filters
+        Index('ix_messages_conv_sent', 'conversation_id', 'sent_at'),
+        Index('ix_messages_sender_sent', 'sender_id', 'sent_at'),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     message_id = Column(String, unique=True, nullable=False, index=True)
-    conversation_id = Column(Integer, ForeignKey("conversations.id", ondelete="CASCADE"), nullable=False, index=True)
-    sender_id = Column(Integer, ForeignKey("participants.id", ondelete="CASCADE"), nullable=False, index=True)
+    conversation_id = Column(Integer, ForeignKey("conversations.id", ondelete="CASCADE"), nullable=False)
+    sender_id = Column(Integer, ForeignKey("participants.id", ondelete="CASCADE"), nullable=False)
     content = Column(Text, nullable=True)
-    sent_at = Column(DateTime, nullable=False, index=True)
-    created_at = Column(DateTime, default=func.now(), nullable=False)
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=False)
+    sent_at = Column(DateTime, nullable=False, index=True)  # global MIN/MAX in summaries
+    created_at = Column(DateTime, default=func.now(), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime, default=func.now(), server_default=func.now(), onupdate=func.now(), nullable=False)
     
     # Relationships
     conversation = relationship("Conversation", back_populates="messages")
@@ -92,15 +127,17 @@ class ConversationParticipant(Base):
     """Junction table linking conversations and participants (many-to-many)"""
     __tablename__ = "conversation_participants"
     __table_args__ = (
+        # Also serves conversation_id lookups (leading column)
         UniqueConstraint('conversation_id', 'participant_id', name='uq_conv_participant'),
+        Index('ix_conv_participants_participant_conv', 'participant_id', 'conversation_id'),
     )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
-    conversation_id = Column(Integer, ForeignKey("conversations.id", ondelete="CASCADE"), nullable=False, index=True)
-    participant_id = Column(Integer, ForeignKey("participants.id", ondelete="CASCADE"), nullable=False, index=True)
+    conversation_id = Column(Integer, ForeignKey("conversations.id", ondelete="CASCADE"), nullable=False)
+    participant_id = Column(Integer, ForeignKey("participants.id", ondelete="CASCADE"), nullable=False)
     joined_at = Column(DateTime, nullable=True)
     left_at = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, default=func.now(), nullable=False)
+    created_at = Column(DateTime, default=func.now(), server_default=func.now(), nullable=False)
     
     # Relationships
     conversation = relationship("Conversation", back_populates="participants")
@@ -114,6 +151,13 @@ class ConversationParticipant(Base):
 # METADATA & TRACKING
 # ============================================================================
 
+class IngestionStatus(enum.StrEnum):
+    """Lifecycle states of an ingestion run (stored as their lowercase values)"""
+    RUNNING = 'running'
+    SUCCESS = 'success'
+    FAILED = 'failed'
+
+
 class IngestionRun(Base):
     """Tracks each ETL job execution for auditing and reconciliation"""
     __tablename__ = "ingestion_runs"
@@ -124,7 +168,17 @@ class IngestionRun(Base):
     source_zip_hash = Column(String, nullable=False)
     started_at = Column(DateTime, nullable=False, index=True)
     completed_at = Column(DateTime, nullable=True)
-    status = Column(String, nullable=False, index=True)  # 'running', 'success', 'failed'
+    status = Column(
+        Enum(
+            IngestionStatus,
+            native_enum=False,
+            create_constraint=False,
+            length=16,
+            values_callable=lambda statuses: [s.value for s in statuses]
+        ),
+        nullable=False,
+        index=True
+    )
     total_messages_found = Column(Integer, default=0)
     total_messages_inserted = Column(Integer, default=0)
     total_conversations_found = Column(Integer, default=0)
@@ -132,7 +186,7 @@ class IngestionRun(Base):
     total_participants_found = Column(Integer, default=0)
     total_participants_inserted = Column(Integer, default=0)
     error_message = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=func.now(), nullable=False)
+    created_at = Column(DateTime, default=func.now(), server_default=func.now(), nullable=False)
     
     # Relationships
     message_tracking = relationship("MessageIngestionTracking", back_populates="ingestion_run", cascade="all, delete-orphan")
@@ -152,7 +206,7 @@ class MessageIngestionTracking(Base):
     message_id = Column(Integer, ForeignKey("messages.id", ondelete="CASCADE"), nullable=False, index=True)
     ingestion_run_id = Column(Integer, ForeignKey("ingestion_runs.id", ondelete="CASCADE"), nullable=False, index=True)
     source_raw_hash = Column(String, nullable=True)
-    created_at = Column(DateTime, default=func.now(), nullable=False)
+    created_at = Column(DateTime, default=func.now(), server_default=func.now(), nullable=False)
     
     # Relationships
     message = relationship("Message", back_populates="ingestion_tracking")
@@ -178,7 +232,7 @@ class MessageAttachment(Base):
     file_url = Column(String, nullable=True)
     file_size_bytes = Column(Integer, nullable=True)
     mime_type = Column(String, nullable=True)
-    created_at = Column(DateTime, default=func.now(), nullable=False)
+    created_at = Column(DateTime, default=func.now(), server_default=func.now(), nullable=False)
     
     # Relationships
     message = relationship("Message", back_populates="attachments")
@@ -192,14 +246,15 @@ class MessageReaction(Base):
     __tablename__ = "message_reactions"
     __table_args__ = (
         UniqueConstraint('message_id', 'participant_id', 'reaction_type', name='uq_msg_reaction'),
+        Index('ix_message_reactions_msg_reacted', 'message_id', 'reacted_at'),
     )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
-    message_id = Column(Integer, ForeignKey("messages.id", ondelete="CASCADE"), nullable=False, index=True)
+    message_id = Column(Integer, ForeignKey("messages.id", ondelete="CASCADE"), nullable=False)
     participant_id = Column(Integer, ForeignKey("participants.id", ondelete="CASCADE"), nullable=False, index=True)
     reaction_type = Column(String, nullable=False)  # 'like', 'love', 'insightful', etc.
     reacted_at = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, default=func.now(), nullable=False)
+    created_at = Column(DateTime, default=func.now(), server_default=func.now(), nullable=False)
     
     # Relationships
     message = relationship("Message", back_populates="reactions")
@@ -214,7 +269,7 @@ class SchemaVersion(Base):
     __tablename__ = "schema_version"
     
     version = Column(Integer, primary_key=True)
-    applied_at = Column(DateTime, default=func.now(), nullable=False)
+    applied_at = Column(DateTime, default=func.now(), server_default=func.now(), nullable=False)
     description = Column(Text, nullable=True)
     
     def __repr__(self):
@@ -237,6 +292,21 @@ def update_conversation_timestamps(mapper, connection, target):
 
 from sqlalchemy import create_engine
 
+def make_ingestion_sessionmaker(engine) -> sessionmaker:
+    """
+    Create the session factory tuned for bulk ingestion.
+    Build it once per engine; ingestion code should use its sessions
+    instead of the default session factory.
+    
+    - expire_on_commit=False: the job commits between stages and keeps using
+      the objects it created (e.g. the IngestionRun); without this every
+      attribute access after a commit re-SELECTs the row
+    - autoflush=False: the upsert methods flush explicitly when they need
+      database ids, so queries don't trigger implicit flushes
+    """
+    return sessionmaker(bind=engine, expire_on_commit=False, autoflush=False)
+
+
 def init_db():
     """
     Initialize database tables.
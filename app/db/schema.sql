@@ -52,8 +52,8 @@ CREATE TABLE IF NOT EXISTS messages (
 );
 
 CREATE INDEX idx_messages_message_id ON messages(message_id);
-CREATE INDEX idx_messages_conversation_id ON messages(conversation_id);
-CREATE INDEX idx_messages_sender_id ON messages(sender_id);
+CREATE INDEX idx_messages_conv_sent ON messages(conversation_id, sent_at);
+CREATE INDEX idx_messages_sender_sent ON messages(sender_id, sent_at);
 CREATE INDEX idx_messages_sent_at ON messages(sent_at);
 
 -- Conversation participants junction table (many-to-many)
@@ -70,8 +70,8 @@ CREATE TABLE IF NOT EXISTS conversation_participants (
     UNIQUE(conversation_id, participant_id)      -- Prevent duplicate entries
 );
 
-CREATE INDEX idx_conv_participants_conversation ON conversation_participants(conversation_id);
-CREATE INDEX idx_conv_participants_participant ON conversation_participants(participant_id);
+-- conversation_id lookups use the UNIQUE(conversation_id, participant_id) index
+CREATE INDEX idx_conv_participants_participant_conv ON conversation_participants(participant_id, conversation_id);
 
 -- ============================================================================
 -- METADATA & TRACKING
@@ -151,7 +151,7 @@ CREATE TABLE IF NOT EXISTS message_reactions (
     UNIQUE(message_id, participant_id, reaction_type)
 );
 
-CREATE INDEX idx_reactions_message ON message_reactions(message_id);
+CREATE INDEX idx_reactions_message_reacted ON message_reactions(message_id, reacted_at);
 CREATE INDEX idx_reactions_participant ON message_reactions(participant_id);
 
 -- ============================================================================
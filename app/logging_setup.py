@@ -0,0 +1,44 @@
+"""
+app/logging_setup.py
+
+Logging configuration shared by the API and the CLI.
+"""
+
+import logging
+import logging.handlers
+import queue
+
+from app.config import settings
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+
+def configure_logging() -> logging.handlers.QueueListener:
+    """
+    Route root logging through a queue drained by a background listener.
+
+    Callers only enqueue records; the listener thread owns the console and
+    file handlers, so log I/O never blocks the event loop or the ingestion
+    worker. Replaces any root handlers from a previous call.
+
+    Returns:
+        The QueueListener, not yet started. Callers start() it and stop() it
+        on shutdown to flush pending records.
+    """
+    level = logging.getLevelNamesMapping().get(settings.LOG_LEVEL.upper(), logging.INFO)
+
+    formatter = logging.Formatter(LOG_FORMAT)
+    handlers = [logging.StreamHandler(), logging.FileHandler(settings.LOG_FILE)]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    logging.basicConfig(
+        level=level,
+        # The queue only carries the merged message; the listener's handlers
+        # apply the real format
+        format='%(message)s',
+        handlers=[logging.handlers.QueueHandler(log_queue)],
+        force=True
+    )
+    return logging.handlers.QueueListener(log_queue, *handlers)
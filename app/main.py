@@ -8,25 +8,17 @@ import logging
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
-from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 
 from app.config import settings
 from app.api.routes import router
 from app.db.models import init_db
+from app.logging_setup import configure_logging
 from app.scheduler.jobs import scheduled_ingestion, scheduled_health_check
 
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, settings.LOG_LEVEL.upper()),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler(settings.LOG_FILE)
-    ]
-)
-
 logger = logging.getLogger(__name__)
 
 # Global scheduler instance
@@ -39,6 +31,9 @@ async def lifespan(app: FastAPI):
     Lifespan context manager for startup and shutdown events.
     """
     # Startup
+    # Queued logging; the listener thread does the console/file I/O
+    log_listener = configure_logging()
+    log_listener.start()
     logger.info("Starting LinkedIn Ingestor application...")
     
     # Initialize database
@@ -48,7 +43,9 @@ async def lifespan(app: FastAPI):
     
     # Start scheduler
     global scheduler
-    scheduler = BackgroundScheduler(timezone=settings.TIMEZONE)
+    # Runs on the app's event loop; jobs hand their sync work to a thread, and
+    # shutdown doesn't block the loop waiting for a running ingestion
+    scheduler = AsyncIOScheduler(timezone=settings.TIMEZONE)
     
     # Add weekly ingestion job
     if settings.SCHEDULER_ENABLED:
@@ -93,6 +90,7 @@ async def lifespan(app: FastAPI):
         logger.info("Scheduler stopped")
     
     logger.info("Application shutdown complete")
+    log_listener.stop()  # Flushes pending records
 
 
 # Create FastAPI application
@@ -100,7 +98,8 @@ app = FastAPI(
     title="LinkedIn Data Ingestor",
     description="Automated LinkedIn data export processing and normalization pipeline",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware (configure as needed)
@@ -5,12 +5,16 @@ Background scheduled jobs for LinkedIn data ingestion.
 Uses APScheduler to run weekly ingestion and health checks.
 """
 
+import asyncio
 import logging
+import threading
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Tuple
 from pathlib import Path
 import traceback
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
 
 from app.config import settings
 from app.services.storage import storage_service
@@ -19,13 +23,11 @@ from app.connectors.data_export import DataExportConnector
 from app.services.normalize import normalize_service
 from app.services.zip_package import zip_package_service
 from app.services.reconcile import reconciliation_service
-from app.db.repo import DatabaseRepository
+from app.db.repo import repository
+from app.db.models import IngestionStatus
 
 logger = logging.getLogger(__name__)
 
-# Initialize database repository
-repository = DatabaseRepository(db_url=settings.DATABASE_URL)
-
 
 class IngestionJob:
     """Handles the complete LinkedIn data ingestion workflow."""
@@ -34,18 +36,46 @@ class IngestionJob:
         """Initialize ingestion job."""
         self.last_run_status = None
         self.current_run_id = None
+        self.current_future: Optional[Future] = None  # Set when submitted via the API executor
         self.repo = repository
+        # SMTP sends run here so a slow mail server doesn't hold the run open
+        self._mail_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="mailer")
+        # One run at a time: the scheduler, the API worker and the CLI share
+        # this job and the repository's per-run id caches
+        self._run_lock = threading.Lock()
     
     def run_ingestion(self, zip_path: Optional[str] = None) -> dict:
         """
         Execute complete ingestion workflow using the new repo.py architecture.
         
+        If another run is already in progress this returns immediately with
+        status SKIPPED instead of running concurrently.
+        
         Args:
             zip_path: Optional path to specific ZIP file. If None, uses latest from incoming/
             
         Returns:
             Run status dictionary
         """
+        if not self._run_lock.acquire(blocking=False):
+            logger.warning("Ingestion already running [run_id: %s]; skipping", self.current_run_id)
+            now = datetime.utcnow().isoformat()
+            return {
+                "run_id": None,
+                "start_time": now,
+                "end_time": now,
+                "status": "SKIPPED",
+                "stage": "already_running",
+                "error": "Another ingestion run is in progress",
+                "stats": {}
+            }
+        try:
+            return self._run_ingestion(zip_path)
+        finally:
+            self._run_lock.release()
+    
+    def _run_ingestion(self, zip_path: Optional[str]) -> dict:
+        """Ingestion workflow body; run_ingestion() holds the run lock around it."""
         run_id = str(uuid.uuid4())
         self.current_run_id = run_id
         
@@ -59,10 +89,10 @@ class IngestionJob:
             "stats": {}
         }
         
-        logger.info(f"Starting ingestion job [run_id: {run_id}]")
+        logger.info("Starting ingestion job [run_id: %s]", run_id)
         
         # Create database session
-        session = self.repo.get_session()
+        session = self.repo.get_ingestion_session()
         ingestion_run = None
         
         try:
@@ -77,7 +107,7 @@ class IngestionJob:
                 if not source_zip:
                     raise FileNotFoundError("No ZIP files found in incoming directory")
             
-            logger.info(f"Using source ZIP: {source_zip.name}")
+            logger.info("Using source ZIP: %s", source_zip.name)
             run_status["stats"]["source_file"] = source_zip.name
             
             # Compute ZIP hash and check if already ingested
@@ -86,7 +116,7 @@ class IngestionJob:
             run_status["stats"]["source_hash"] = zip_hash
             
             if self.repo.check_zip_already_ingested(session, zip_hash):
-                logger.warning(f"ZIP already ingested: {source_zip.name} (hash: {zip_hash[:8]}...)")
+                logger.warning("ZIP already ingested: %s (hash: %s...)", source_zip.name, zip_hash[:8])
                 run_status["status"] = "SKIPPED"
                 run_status["stage"] = "duplicate_detected"
                 run_status["error"] = "ZIP file already successfully ingested"
@@ -102,7 +132,7 @@ class IngestionJob:
                 started_at=datetime.utcnow()
             )
             session.commit()
-            logger.info(f"Created ingestion run record: {run_id}")
+            logger.info("Created ingestion run record: %s", run_id)
             
             # Stage 3: Extract and parse raw data
             run_status["stage"] = "parsing"
@@ -114,11 +144,14 @@ class IngestionJob:
                 "conversations": len(raw_data.get('conversations', [])),
                 "messages": len(raw_data.get('messages', []))
             }
-            logger.info(f"Extracted raw data: {run_status['stats']['raw_counts']}")
+            logger.info("Extracted raw data: %s", run_status['stats']['raw_counts'])
             
             # Stage 4: Normalize data
             run_status["stage"] = "normalizing"
             normalized_data = normalize_service.normalize_all(raw_data)
+            # Raw records aren't needed past this point; release them before
+            # the DB stage so only the normalized copy stays resident
+            del raw_data
             
             # Get normalized counts
             norm_counts = {
@@ -129,7 +162,7 @@ class IngestionJob:
             }
             run_status["stats"]["normalized_counts"] = norm_counts
             run_status["stats"]["normalization_stats"] = normalized_data.get('stats', {})
-            logger.info(f"Normalized data: {norm_counts}")
+            logger.info("Normalized data: %s", norm_counts)
             
             # Stage 5: Insert into database using repo.py
             run_status["stage"] = "inserting_db"
@@ -140,7 +173,7 @@ class IngestionJob:
             )
             
             run_status["stats"]["db_inserted"] = inserted_counts
-            logger.info(f"Database insertion complete: {inserted_counts}")
+            logger.info("Database insertion complete: %s", inserted_counts)
             
             # Commit all inserts
             session.commit()
@@ -161,7 +194,7 @@ class IngestionJob:
             self.repo.update_ingestion_run(
                 session=session,
                 run_db_id=ingestion_run.id,
-                status='success',
+                status=IngestionStatus.SUCCESS,
                 completed_at=datetime.utcnow(),
                 stats={
                     'messages_found': norm_counts['messages'],
@@ -187,7 +220,7 @@ class IngestionJob:
                     # Include empty lists (empty tables)
                     package_data[key] = value
 
-            logger.info(f"Packaging tables: {list(package_data.keys())}")
+            logger.info("Packaging tables: %s", list(package_data))
 
             output_zip = zip_package_service.create_package(
                 data=package_data,
@@ -203,7 +236,7 @@ class IngestionJob:
             # Save output package
             saved_output = storage_service.save_output_zip(output_zip, run_id)
             run_status["stats"]["output_file"] = saved_output.name
-            logger.info(f"Created output package: {saved_output.name}")
+            logger.info("Created output package: %s", saved_output.name)
             
             # Stage 9: Archive source ZIP
             run_status["stage"] = "archiving"
@@ -216,28 +249,31 @@ class IngestionJob:
             
             # Stage 10: Send email
             run_status["stage"] = "emailing"
-            logger.info(f"EMAIL_ENABLED: {settings.EMAIL_ENABLED}")
-            logger.info(f"RECIPIENT_EMAILS: {settings.recipient_emails_list}")
-            logger.info(f"Emailer service enabled: {emailer_service.enabled}")
+            logger.info("EMAIL_ENABLED: %s", settings.EMAIL_ENABLED)
+            logger.info("RECIPIENT_EMAILS: %s", settings.RECIPIENT_EMAILS)
+            logger.info("Emailer service enabled: %s", emailer_service.enabled)
 
-            if settings.EMAIL_ENABLED and settings.recipient_emails_list and emailer_service.enabled:
-                logger.info("Attempting to send email...")
-                email_sent = emailer_service.send_data_package(
-                    to_emails=settings.recipient_emails_list,  # Changed
+            if settings.EMAIL_ENABLED and settings.RECIPIENT_EMAILS and emailer_service.enabled:
+                logger.info("Queueing email...")
+                email_future = self._mail_executor.submit(
+                    emailer_service.send_data_package,
+                    to_emails=settings.RECIPIENT_EMAILS,  # Changed
                     zip_path=saved_output,
                     run_id=run_id,
                     record_counts=inserted_counts
                 )
-                run_status["stats"]["email_sent"] = email_sent
-                logger.info(f"Email send result: {email_sent}")
+                # Replaced with the send result once the mailer finishes
+                run_status["stats"]["email_sent"] = "QUEUED"
+                email_future.add_done_callback(partial(self._record_email_result, run_status))
             else:
                 run_status["stats"]["email_sent"] = False
-                logger.warning(f"Email NOT sent - EMAIL_ENABLED={settings.EMAIL_ENABLED}, recipients={len(settings.recipient_emails_list)}, service_enabled={emailer_service.enabled}")
+                logger.warning("Email NOT sent - EMAIL_ENABLED=%s, recipients=%s, service_enabled=%s",
+                               settings.EMAIL_ENABLED, len(settings.RECIPIENT_EMAILS), emailer_service.enabled)
                         
             # Success!
             run_status["status"] = "SUCCESS"
             run_status["stage"] = "completed"
-            logger.info(f"Ingestion completed successfully [run_id: {run_id}]")
+            logger.info("Ingestion completed successfully [run_id: %s]", run_id)
             
         except Exception as e:
             # Handle failure
@@ -245,7 +281,7 @@ class IngestionJob:
             run_status["error"] = str(e)
             run_status["traceback"] = traceback.format_exc()
             
-            logger.error(f"Ingestion failed [run_id: {run_id}]: {e}", exc_info=True)
+            logger.error("Ingestion failed [run_id: %s]: %s", run_id, e, exc_info=True)
             
             # Update ingestion run as failed
             if ingestion_run:
@@ -253,34 +289,59 @@ class IngestionJob:
                     self.repo.update_ingestion_run(
                         session=session,
                         run_db_id=ingestion_run.id,
-                        status='failed',
+                        status=IngestionStatus.FAILED,
                         completed_at=datetime.utcnow(),
                         error_message=str(e)
                     )
                     session.commit()
                 except Exception as update_err:
-                    logger.error(f"Failed to update ingestion run status: {update_err}")
+                    logger.error("Failed to update ingestion run status: %s", update_err)
             
             # Rollback transaction
             session.rollback()
+            # Ids cached during this run may point at rolled-back rows
+            self.repo.clear_id_caches()
             
             # Send error notification
-            if settings.EMAIL_ENABLED and settings.recipient_emails_list and emailer_service.enabled:
-                logger.info("Sending error notification email...")
-                emailer_service.send_error_notification(
-                    to_emails=settings.recipient_emails_list,  # Changed
+            if settings.EMAIL_ENABLED and settings.RECIPIENT_EMAILS and emailer_service.enabled:
+                logger.info("Queueing error notification email...")
+                self._mail_executor.submit(
+                    emailer_service.send_error_notification,
+                    to_emails=settings.RECIPIENT_EMAILS,  # Changed
                     error_message=str(e),
                     run_id=run_id
-                )
+                ).add_done_callback(partial(self._record_email_result, None))
         
         finally:
             run_status["end_time"] = datetime.utcnow().isoformat()
             self.last_run_status = run_status
             self.current_run_id = None
             session.close()
+            # Run rows (and possibly data) changed - drop cached table counts
+            self.repo.invalidate_counts()
         
         return run_status
     
+    @staticmethod
+    def _record_email_result(run_status: Optional[dict], future: Future) -> None:
+        """
+        Done-callback for queued emails: log the outcome and, for the data
+        package email, store it in run_status["stats"]["email_sent"].
+        
+        Args:
+            run_status: Status dict of the run that queued the email, or None
+            future: Completed mailer future
+        """
+        try:
+            email_sent = future.result()
+        except Exception as e:
+            logger.error("Email send failed: %s", e, exc_info=True)
+            email_sent = False
+        
+        if run_status is not None:
+            run_status["stats"]["email_sent"] = email_sent
+        logger.info("Email send result: %s", email_sent)
+    
     def _insert_normalized_data(
         self,
         session,
@@ -305,30 +366,18 @@ class IngestionJob:
             'conversation_participants': 0
         }
         
-        # Step 1: Upsert participants
+        # Step 1: Upsert participants (one INSERT ... ON CONFLICT batch)
         logger.info("Inserting participants...")
-        participant_map = {}  # linkedin_id -> db_id
-        
-        for participant_data in normalized_data.get('participants', []):
-            participant = self.repo.upsert_participant(
-                session=session,
-                linkedin_id=participant_data['linkedin_id'],
-                full_name=participant_data['full_name'],
-                profile_url=participant_data.get('profile_url'),
-                email=participant_data.get('email'),
-                headline=participant_data.get('headline')
-            )
-            participant_map[participant.linkedin_id] = participant.id
-            inserted_counts['participants'] += 1
+        participants = normalized_data.get('participants', [])
+        participant_map = self.repo.bulk_upsert_participants(session, participants)  # linkedin_id -> db_id
+        inserted_counts['participants'] = len(participants)
         
-        logger.info(f"Inserted {inserted_counts['participants']} participants")
+        logger.info("Inserted %s participants", inserted_counts['participants'])
         
         # Step 2: Upsert conversations
         logger.info("Inserting conversations...")
-        conversation_map = {}  # conversation_id -> db_id
+        conversation_rows = []
         
-        from datetime import datetime
-
         for conv_data in normalized_data.get('conversations', []):
             # Ensure datetime objects, not strings
             first_msg_at = conv_data.get('first_message_at')
@@ -347,56 +396,45 @@ class IngestionJob:
                 except:
                     last_msg_at = None
             
-            conversation = self.repo.upsert_conversation(
-                session=session,
-                conversation_id=conv_data['conversation_id'],
-                conversation_title=conv_data.get('conversation_title'),
-                is_group_chat=conv_data.get('is_group_chat', False),
-                first_message_at=first_msg_at,
-                last_message_at=last_msg_at
-            )
-        # for conv_data in normalized_data.get('conversations', []):
-        #     conversation = self.repo.upsert_conversation(
-        #         session=session,
-        #         conversation_id=conv_data['conversation_id'],
-        #         conversation_title=conv_data.get('conversation_title'),
-        #         is_group_chat=conv_data.get('is_group_chat', False),
-        #         first_message_at=conv_data.get('first_message_at'),
-        #         last_message_at=conv_data.get('last_message_at')
-        #     )
-        #     conversation_map[conversation.conversation_id] = conversation.id
-        #     inserted_counts['conversations'] += 1
-        
-        logger.info(f"Inserted {inserted_counts['conversations']} conversations")
+            conversation_rows.append({
+                'conversation_id': conv_data['conversation_id'],
+                'conversation_title': conv_data.get('conversation_title'),
+                'is_group_chat': conv_data.get('is_group_chat', False),
+                'first_message_at': first_msg_at,
+                'last_message_at': last_msg_at
+            })
+        
+        conversation_map = self.repo.bulk_upsert_conversations(session, conversation_rows)  # conversation_id -> db_id
+        inserted_counts['conversations'] = len(conversation_rows)
+        
+        logger.info("Inserted %s conversations", inserted_counts['conversations'])
         
         # Step 3: Link conversation participants (junction table)
         logger.info("Linking conversation participants...")
+        junction_rows = []
         
         for junction_data in normalized_data.get('conversation_participants', []):
             conv_id = junction_data['conversation_id']
             participant_linkedin_id = junction_data['participant_linkedin_id']
             
-            # Get database IDs
-            conv_db_id = conversation_map.get(conv_id)
-            participant_db_id = participant_map.get(participant_linkedin_id)
-            
-            if conv_db_id and participant_db_id:
-                self.repo.upsert_conversation_participant(
-                    session=session,
-                    conversation_db_id=conv_db_id,
-                    participant_db_id=participant_db_id,
-                    joined_at=junction_data.get('joined_at'),
-                    left_at=junction_data.get('left_at')
-                )
-                inserted_counts['conversation_participants'] += 1
+            if conv_id in conversation_map and participant_linkedin_id in participant_map:
+                junction_rows.append(junction_data)
             else:
-                logger.warning(f"Skipping junction link - missing IDs: "
-                             f"conv={conv_id}, participant={participant_linkedin_id}")
+                logger.warning("Skipping junction link - missing IDs: conv=%s, participant=%s",
+                               conv_id, participant_linkedin_id)
+        
+        # Foreign keys are resolved by business key inside one INSERT ... SELECT
+        self.repo.bulk_link_participants(session, junction_rows)
+        inserted_counts['conversation_participants'] = len(junction_rows)
         
-        logger.info(f"Linked {inserted_counts['conversation_participants']} conversation-participant pairs")
+        logger.info("Linked %s conversation-participant pairs", inserted_counts['conversation_participants'])
         
         # Step 4: Upsert messages
         logger.info("Inserting messages...")
+        message_rows = []
+        # message_id -> source row, hashed for tracking after the batch
+        # (first occurrence wins, as with per-row tracking)
+        tracked_sources = {}
         
         for msg_data in normalized_data.get('messages', []):
             # Get database IDs from maps
@@ -404,40 +442,40 @@ class IngestionJob:
             sender_db_id = participant_map.get(msg_data['sender_linkedin_id'])
             
             if not conv_db_id:
-                logger.warning(f"Skipping message {msg_data['message_id']} - "
-                             f"conversation not found: {msg_data['conversation_id']}")
+                logger.warning("Skipping message %s - conversation not found: %s",
+                               msg_data['message_id'], msg_data['conversation_id'])
                 continue
             
             if not sender_db_id:
-                logger.warning(f"Skipping message {msg_data['message_id']} - "
-                             f"sender not found: {msg_data['sender_linkedin_id']}")
+                logger.warning("Skipping message %s - sender not found: %s",
+                               msg_data['message_id'], msg_data['sender_linkedin_id'])
                 continue
             
-            # Insert message
-            message = self.repo.upsert_message(
-                session=session,
-                message_id=msg_data['message_id'],
-                conversation_db_id=conv_db_id,
-                sender_db_id=sender_db_id,
-                content=msg_data.get('content'),
-                sent_at=msg_data['sent_at']
-            )
-            
-            # Track message ingestion
-            self.repo.track_message_ingestion(
-                session=session,
-                message_db_id=message.id,
-                ingestion_run_db_id=ingestion_run_db_id,
-                source_raw_hash=self.repo.compute_hash(msg_data)
-            )
-            
-            inserted_counts['messages'] += 1
-            
-            # Log progress every 100 messages
-            if inserted_counts['messages'] % 100 == 0:
-                logger.debug(f"Inserted {inserted_counts['messages']} messages...")
-        
-        logger.info(f"Inserted {inserted_counts['messages']} messages")
+            message_rows.append({
+                'message_id': msg_data['message_id'],
+                'conversation_id': conv_db_id,
+                'sender_id': sender_db_id,
+                'content': msg_data.get('content'),
+                'sent_at': msg_data['sent_at']
+            })
+            tracked_sources.setdefault(msg_data['message_id'], msg_data)
+        
+        # Also widens the touched conversations' first/last message window
+        message_map = self.repo.bulk_upsert_messages(session, message_rows)  # message_id -> db_id
+        inserted_counts['messages'] = len(message_rows)
+        
+        # Hash the tracked source rows in one batch
+        source_hashes = dict(zip(
+            (message_map[message_id] for message_id in tracked_sources),
+            self.repo.compute_hashes(list(tracked_sources.values()))
+        ))
+        self.repo.track_message_ingestion_bulk(
+            session=session,
+            ingestion_run_db_id=ingestion_run_db_id,
+            source_hashes=source_hashes
+        )
+        
+        logger.info("Inserted %s messages", inserted_counts['messages'])
         
         return inserted_counts
     
@@ -510,8 +548,26 @@ class IngestionJob:
         return self.last_run_status
     
     def is_running(self) -> bool:
-        """Check if a job is currently running."""
-        return self.current_run_id is not None
+        """Check if a job is currently running (or queued to start)."""
+        return self.snapshot()[0]
+    
+    def snapshot(self) -> Tuple[bool, Optional[str]]:
+        """
+        Read running state and run ID together.
+        
+        Each attribute is read exactly once, so callers get a consistent
+        pair without taking a lock.
+        
+        Returns:
+            Tuple of (is_running, current_run_id)
+        """
+        run_id = self.current_run_id
+        if run_id is not None:
+            return True, run_id
+        if self._run_lock.locked():
+            return True, None
+        future = self.current_future
+        return future is not None and not future.done(), None
 
 
 class HealthCheckJob:
@@ -520,6 +576,7 @@ class HealthCheckJob:
     def __init__(self):
         """Initialize health check job."""
         self.repo = repository
+        self._probe_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="health-probe")
     
     def run_health_check(self) -> dict:
         """
@@ -536,28 +593,29 @@ class HealthCheckJob:
             "components": {}
         }
         
+        # Database and storage probes are independent I/O - run them concurrently
+        db_future = self._probe_executor.submit(self._probe_database)
+        storage_future = self._probe_executor.submit(storage_service.get_storage_stats)
+        
         # Check database connectivity
         try:
-            session = self.repo.get_session()
-            db_summary = self.repo.get_database_summary(session)
-            session.close()
-            
+            db_summary = db_future.result()
             health_status["components"]["database"] = "OK"
             health_status["database_summary"] = db_summary
         except Exception as e:
             health_status["components"]["database"] = f"ERROR: {str(e)}"
             health_status["status"] = "UNHEALTHY"
-            logger.error(f"Database health check failed: {e}")
+            logger.error("Database health check failed: %s", e)
         
         # Check storage directories
         try:
-            stats = storage_service.get_storage_stats()
+            stats = storage_future.result()
             health_status["components"]["storage"] = "OK"
             health_status["storage_stats"] = stats
         except Exception as e:
             health_status["components"]["storage"] = f"ERROR: {str(e)}"
             health_status["status"] = "UNHEALTHY"
-            logger.error(f"Storage health check failed: {e}")
+            logger.error("Storage health check failed: %s", e)
         
         # Check email configuration (if enabled)
         if settings.EMAIL_ENABLED:
@@ -568,12 +626,20 @@ class HealthCheckJob:
                     health_status["components"]["email"] = "DISABLED"
             except Exception as e:
                 health_status["components"]["email"] = f"ERROR: {str(e)}"
-                logger.error(f"Email health check failed: {e}")
+                logger.error("Email health check failed: %s", e)
         else:
             health_status["components"]["email"] = "DISABLED"
         
-        logger.debug(f"Health check completed: {health_status['status']}")
+        logger.debug("Health check completed: %s", health_status['status'])
         return health_status
+    
+    def _probe_database(self) -> dict:
+        """Query the database summary (doubles as a connectivity check)."""
+        session = self.repo.get_session()
+        try:
+            return self.repo.get_database_summary(session)
+        finally:
+            session.close()
 
 
 # Singleton instances
@@ -581,23 +647,24 @@ ingestion_job = IngestionJob()
 health_check_job = HealthCheckJob()
 
 
-# Scheduled job functions (called by APScheduler)
-def scheduled_ingestion():
+# Scheduled job functions (called by APScheduler's AsyncIOScheduler on the
+# app's event loop; the synchronous work runs on a worker thread)
+async def scheduled_ingestion():
     """Scheduled ingestion job wrapper."""
     logger.info("Triggered scheduled ingestion")
     try:
-        result = ingestion_job.run_ingestion()
+        result = await asyncio.to_thread(ingestion_job.run_ingestion)
         return result
     except Exception as e:
-        logger.error(f"Scheduled ingestion failed: {e}", exc_info=True)
+        logger.error("Scheduled ingestion failed: %s", e, exc_info=True)
         raise
 
 
-def scheduled_health_check():
+async def scheduled_health_check():
     """Scheduled health check job wrapper."""
     try:
-        result = health_check_job.run_health_check()
+        result = await asyncio.to_thread(health_check_job.run_health_check)
         return result
     except Exception as e:
-        logger.error(f"Scheduled health check failed: {e}", exc_info=True)
+        logger.error("Scheduled health check failed: %s", e, exc_info=True)
         raise
\ No newline at end of file
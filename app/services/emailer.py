@@ -13,9 +13,10 @@ from email.mime.text import MIMEText
 from email.mime.base import MIMEBase
 from email import encoders
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, Sequence
 from datetime import datetime
 import logging
+import time
 
 from app.config import settings
 
@@ -25,6 +26,9 @@ logger = logging.getLogger(__name__)
 class EmailerService:
     """Handles email delivery with attachments via SMTP."""
     
+    # How long a connection test verdict is reused before probing again
+    PROBE_CACHE_TTL_SECONDS = 30
+    
     def __init__(self):
         """Initialize emailer with SMTP configuration from settings."""
         # Load all settings first
@@ -36,6 +40,10 @@ class EmailerService:
         self.use_tls = settings.SMTP_USE_TLS
         self.enabled = settings.EMAIL_ENABLED
         
+        # Last SMTP probe result (see test_connection)
+        self._last_probe_ts: Optional[float] = None
+        self._last_probe_ok = False
+        
         # Debug logging
         logger.info("=" * 60)
         logger.info("EMAIL SERVICE INITIALIZATION")
@@ -47,7 +55,6 @@ class EmailerService:
         logger.info(f"FROM_EMAIL: {self.from_email}")
         logger.info(f"SMTP_PASSWORD set: {bool(self.smtp_password)}")
         logger.info(f"RECIPIENT_EMAILS: {settings.RECIPIENT_EMAILS}")
-        logger.info(f"Parsed recipients: {settings.recipient_emails_list}")
         logger.info("=" * 60)
         
         # Only validate if email is enabled
@@ -87,13 +94,13 @@ class EmailerService:
             logger.info(f"✓ SMTP Server: {self.smtp_host}:{self.smtp_port}")
             logger.info(f"✓ SMTP User: {self.smtp_user}")
             logger.info(f"✓ From: {self.from_email}")
-            logger.info(f"✓ Recipients: {len(settings.recipient_emails_list)} configured")
+            logger.info(f"✓ Recipients: {len(settings.RECIPIENT_EMAILS)} configured")
             logger.info("✓ Email service is READY")
             logger.info("=" * 60)
     
     def send_data_package(
         self,
-        to_emails: List[str],
+        to_emails: Sequence[str],
         zip_path: Path,
         run_id: Optional[str] = None,
         record_counts: Optional[dict] = None,
@@ -103,7 +110,7 @@ class EmailerService:
         Send LinkedIn data package via email.
         
         Args:
-            to_emails: List of recipient email addresses
+            to_emails: Recipient email addresses
             zip_path: Path to ZIP file to attach
             run_id: Optional run identifier for email body
             record_counts: Optional dict of table counts for email body
@@ -148,7 +155,7 @@ class EmailerService:
     
     def _create_message(
         self,
-        to_emails: List[str],
+        to_emails: Sequence[str],
         zip_path: Path,
         run_id: Optional[str],
         record_counts: Optional[dict],
@@ -158,7 +165,7 @@ class EmailerService:
         Create email message with attachment.
         
         Args:
-            to_emails: List of recipient email addresses
+            to_emails: Recipient email addresses
             zip_path: Path to ZIP attachment
             run_id: Optional run identifier
             record_counts: Optional dict of record counts
@@ -312,13 +319,13 @@ class EmailerService:
             )
             msg.attach(part)
     
-    def _send_smtp(self, msg: MIMEMultipart, to_emails: List[str]) -> None:
+    def _send_smtp(self, msg: MIMEMultipart, to_emails: Sequence[str]) -> None:
         """
         Send email via SMTP server.
         
         Args:
             msg: Prepared MIMEMultipart message
-            to_emails: List of recipient email addresses
+            to_emails: Recipient email addresses
             
         Raises:
             smtplib.SMTPException: If SMTP operation fails
@@ -347,7 +354,7 @@ class EmailerService:
     
     def send_error_notification(
         self,
-        to_emails: List[str],
+        to_emails: Sequence[str],
         error_message: str,
         run_id: Optional[str] = None,
     ) -> bool:
@@ -355,7 +362,7 @@ class EmailerService:
         Send error notification email without attachment.
         
         Args:
-            to_emails: List of recipient email addresses
+            to_emails: Recipient email addresses
             error_message: Error description
             run_id: Optional run identifier
             
@@ -419,10 +426,16 @@ class EmailerService:
             logger.error(f"Failed to send error notification: {e}", exc_info=True)
             return False
     
-    def test_connection(self) -> bool:
+    def test_connection(self, force: bool = False) -> bool:
         """
         Test SMTP connection and authentication.
         
+        The verdict is cached for PROBE_CACHE_TTL_SECONDS so repeated checks
+        don't open a new SMTP session each time.
+        
+        Args:
+            force: Ignore the cached verdict and probe the server again
+        
         Returns:
             True if connection successful, False otherwise
         """
@@ -430,6 +443,24 @@ class EmailerService:
             logger.warning("Email is disabled")
             return False
         
+        if (
+            not force
+            and self._last_probe_ts is not None
+            and time.monotonic() - self._last_probe_ts < self.PROBE_CACHE_TTL_SECONDS
+        ):
+            return self._last_probe_ok
+        
+        self._last_probe_ok = self._probe_smtp()
+        self._last_probe_ts = time.monotonic()
+        return self._last_probe_ok
+    
+    def _probe_smtp(self) -> bool:
+        """
+        Open an SMTP session, authenticate, and close it.
+        
+        Returns:
+            True if connection successful, False otherwise
+        """
         try:
             logger.info("Testing SMTP connection...")
             
@@ -447,7 +478,7 @@ class EmailerService:
             return True
             
         except Exception as e:
-            logger.error(f"SMTP connection test failed: {e}", exc_info=True)
+            logger.error("SMTP connection test failed: %s", e)
             return False
 
 
@@ -14,6 +14,22 @@ from collections import defaultdict
 
 logger = logging.getLogger(__name__)
 
+# Cleanup patterns, compiled once instead of per record
+_WHITESPACE_RE = re.compile(r'\s+')
+_NAME_STRIP_RE = re.compile(r"[^\w\s\-'.]")
+_CONTROL_CHARS_RE = re.compile(r'[\x00-\x08\x0b-\x0c\x0e-\x1f\x7f]')
+_EXCESS_NEWLINES_RE = re.compile(r'\n{3,}')
+_REPEATED_SPACES_RE = re.compile(r' {2,}')
+_URL_RE = re.compile(
+    r'^https?://'
+    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'
+    r'localhost|'
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'
+    r'(?::\d+)?'
+    r'(?:/?|[/?]\S+)$', re.IGNORECASE
+)
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
 
 class NormalizeService:
     """Service for normalizing raw data into database-ready records."""
@@ -155,6 +171,7 @@ class NormalizeService:
         logger.info(f"Normalizing {len(raw_records)} participants...")
         
         participants_map: Dict[str, Dict[str, Any]] = {}
+        normalized_at = datetime.utcnow()  # one timestamp for the whole batch
         
         for raw_p in raw_records:
             try:
@@ -191,7 +208,7 @@ class NormalizeService:
                     'email': self._clean_email(raw_p.get('email') or raw_p.get('email_address')),
                     'headline': self._clean_text(raw_p.get('headline')),
                     'first_seen': self._parse_date_to_datetime(raw_p.get('first_seen') or raw_p.get('created_at')),
-                    'created_at': datetime.utcnow()  # Changed from isoformat
+                    'created_at': normalized_at  # Changed from isoformat
                 }
                 
                 # Deduplication: merge data if linkedin_id already exists
@@ -207,7 +224,7 @@ class NormalizeService:
                         'first_seen': normalized['first_seen'] or existing['first_seen'],
                         'created_at': existing['created_at']  # Keep original
                     }
-                    logger.debug(f"Merged duplicate participant: {linkedin_id}")
+                    logger.debug("Merged duplicate participant: %s", linkedin_id)
                 
                 participants_map[linkedin_id] = normalized
                 self.stats['participants_processed'] += 1
@@ -235,6 +252,7 @@ class NormalizeService:
             logger.info(f"Normalizing {len(raw_records)} conversations...")
             
             conversations_map: Dict[str, Dict[str, Any]] = {}
+            normalized_at = datetime.utcnow()  # one timestamp for the whole batch
             
             for raw_c in raw_records:
                 try:
@@ -286,8 +304,8 @@ class NormalizeService:
                         'first_message_at': created_at,  # Now datetime object
                         'last_message_at': self._parse_date_to_datetime(raw_c.get('last_message_at')),  # Now datetime object
                         'message_count': self._to_int(raw_c.get('message_count')) or 0,
-                        'created_at': created_at or datetime.utcnow(),  # Changed from isoformat
-                        'updated_at': datetime.utcnow()  # Changed from isoformat
+                        'created_at': created_at or normalized_at,  # Changed from isoformat
+                        'updated_at': normalized_at  # Changed from isoformat
                     }
                     
                     # Deduplication
@@ -299,7 +317,7 @@ class NormalizeService:
                         normalized['is_group_chat'] = len(all_participants) > 2
                         normalized['conversation_title'] = conversation_title or existing['conversation_title']
                         normalized['created_at'] = existing['created_at']  # Keep original
-                        logger.debug(f"Merged duplicate conversation: {conversation_id}")
+                        logger.debug("Merged duplicate conversation: %s", conversation_id)
                     
                     conversations_map[conversation_id] = normalized
                     self.stats['conversations_processed'] += 1
@@ -344,6 +362,7 @@ class NormalizeService:
             valid_conversation_ids = {c['conversation_id'] for c in normalized_conversations}
         
         messages_map: Dict[str, Dict[str, Any]] = {}
+        normalized_at = datetime.utcnow().isoformat()  # one timestamp for the whole batch
         
         for raw_m in raw_records:
             try:
@@ -408,10 +427,10 @@ class NormalizeService:
                     'sender_linkedin_id': sender_id,
                     'sender_name': self._clean_name(sender_name),
                     'content': normalized_content,
-                    'sent_at': parsed_sent_at if isinstance(parsed_sent_at, datetime) else parsed_sent_at,
+                    'sent_at': parsed_sent_at,
                     'folder': self._clean_string(folder),
                     'attachments': raw_m.get('attachments', []),
-                    'created_at': datetime.utcnow().isoformat()
+                    'created_at': normalized_at
                 }
                 
                 # Track timestamps for conversation updates
@@ -420,7 +439,7 @@ class NormalizeService:
                 
                 # Deduplication
                 if message_id in messages_map:
-                    logger.debug(f"Duplicate message_id found: {message_id}, keeping first occurrence")
+                    logger.debug("Duplicate message_id found: %s, keeping first occurrence", message_id)
                 else:
                     messages_map[message_id] = normalized
                     self.stats['messages_processed'] += 1
@@ -450,6 +469,7 @@ class NormalizeService:
         """
         normalized = []
         seen = set()
+        normalized_at = datetime.utcnow().isoformat()
         
         for idx, record in enumerate(raw_records, start=1):
             first_name = self._get_field(record, ['First Name', 'first_name', 'firstName'])
@@ -476,7 +496,7 @@ class NormalizeService:
                 'company': self._clean_string(company),
                 'position': self._clean_string(position),
                 'connected_on': self._parse_date(connected_on),
-                'created_at': datetime.utcnow().isoformat()
+                'created_at': normalized_at
             })
         
         return normalized
@@ -506,6 +526,7 @@ class NormalizeService:
         Normalize reactions table (LinkedIn reactions).
         """
         normalized = []
+        normalized_at = datetime.utcnow().isoformat()
         
         for idx, record in enumerate(raw_records, start=1):
             reaction_type = self._get_field(record, ['Type', 'reaction_type', 'type'])
@@ -517,7 +538,7 @@ class NormalizeService:
                 'reaction_type': self._clean_string(reaction_type),
                 'reacted_at': self._parse_date(date),
                 'link': self._clean_string(link),
-                'created_at': datetime.utcnow().isoformat()
+                'created_at': normalized_at
             })
         
         return normalized
@@ -599,8 +620,8 @@ class NormalizeService:
             if timestamps:
                 conv['first_message_at'] = min(timestamps)
                 conv['last_message_at'] = max(timestamps)
-                logger.debug(f"Updated timestamps for conversation {conv_id}: "
-                           f"{len(timestamps)} messages")
+                logger.debug("Updated timestamps for conversation %s: %s messages",
+                             conv_id, len(timestamps))
     
     # ==================== UTILITY METHODS ====================
     
@@ -620,7 +641,7 @@ class NormalizeService:
             value = str(value)
         
         value = value.strip()
-        value = re.sub(r'\s+', ' ', value)
+        value = _WHITESPACE_RE.sub(' ', value)
         
         return value if value else None
     
@@ -630,7 +651,7 @@ class NormalizeService:
             return None
         
         name = ' '.join(name.split())
-        name = re.sub(r"[^\w\s\-'.]", '', name)
+        name = _NAME_STRIP_RE.sub('', name)
         name = name.title()
         name = name.strip('.')
         
@@ -642,7 +663,7 @@ class NormalizeService:
             return None
         
         text = text.strip()
-        text = re.sub(r'[\x00-\x08\x0b-\x0c\x0e-\x1f\x7f]', '', text)
+        text = _CONTROL_CHARS_RE.sub('', text)
         text = ' '.join(text.split())
         
         return text if text else None
@@ -652,9 +673,9 @@ class NormalizeService:
         if not content:
             return None
         
-        content = re.sub(r'[\x00-\x08\x0b-\x0c\x0e-\x1f\x7f]', '', content)
-        content = re.sub(r'\n{3,}', '\n\n', content)
-        content = re.sub(r' {2,}', ' ', content)
+        content = _CONTROL_CHARS_RE.sub('', content)
+        content = _EXCESS_NEWLINES_RE.sub('\n\n', content)
+        content = _REPEATED_SPACES_RE.sub(' ', content)
         content = content.strip()
         
         return content if content else None
@@ -666,24 +687,15 @@ class NormalizeService:
         
         url = url.strip()
         
-        url_pattern = re.compile(
-            r'^https?://'
-            r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'
-            r'localhost|'
-            r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'
-            r'(?::\d+)?'
-            r'(?:/?|[/?]\S+)$', re.IGNORECASE
-        )
-        
-        if url_pattern.match(url):
+        if _URL_RE.match(url):
             return url
         
         if not url.startswith(('http://', 'https://')):
             test_url = f"https://{url}"
-            if url_pattern.match(test_url):
+            if _URL_RE.match(test_url):
                 return test_url
         
-        logger.debug(f"Invalid URL: {url}")
+        logger.debug("Invalid URL: %s", url)
         return None
     
     def _clean_email(self, email: Any) -> Optional[str]:
@@ -694,12 +706,10 @@ class NormalizeService:
             return None
         
         email = email.lower()
-        email_pattern = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
-        
-        if email_pattern.match(email):
+        if _EMAIL_RE.match(email):
             return email
         
-        logger.debug(f"Invalid email: {email}")
+        logger.debug("Invalid email: %s", email)
         return None
     
     def _to_int(self, value: Any) -> Optional[int]:
@@ -737,7 +747,7 @@ class NormalizeService:
             except ValueError:
                 continue
         
-        logger.debug(f"Could not parse date: {value}")
+        logger.debug("Could not parse date: %s", value)
         return value
     
     def _parse_date_to_datetime(self, value: Any) -> Optional[datetime]:
@@ -758,13 +768,23 @@ class NormalizeService:
         if not value:
             return None
         
+        # C-level fast path for the ISO-style export timestamps
+        # ("2024-01-15 10:30:00 UTC", "2024-01-15T10:30:00Z"); aware results
+        # are left to the strptime formats so all datetimes stay naive
+        try:
+            parsed = datetime.fromisoformat(value.removesuffix(' UTC').removesuffix('Z'))
+            if parsed.tzinfo is None:
+                return parsed
+        except ValueError:
+            pass
+        
         for date_format in self.date_formats:
             try:
                 return datetime.strptime(value, date_format)
             except ValueError:
                 continue
         
-        logger.debug(f"Could not parse date to datetime: {value}")
+        logger.debug("Could not parse date to datetime: %s", value)
         return None
     
     def _generate_hash(self, *values) -> str:
@@ -8,6 +8,8 @@ Manages three directories:
 - out_zip/: Generated normalized data packages ready for distribution
 """
 
+import heapq
+import os
 import shutil
 from pathlib import Path
 from datetime import datetime
@@ -44,14 +46,15 @@ class StorageService:
         Returns:
             Path to latest ZIP file, or None if no ZIPs found
         """
-        zip_files = list(self.incoming_dir.glob("*.zip"))
+        zip_files = self._scan_zips(self.incoming_dir)
         
         if not zip_files:
             logger.info("No ZIP files found in incoming directory")
             return None
         
-        # Sort by modification time, most recent first
-        latest_zip = max(zip_files, key=lambda p: p.stat().st_mtime)
+        # Most recently modified wins
+        latest_name, _ = max(zip_files, key=lambda item: item[1].st_mtime)
+        latest_zip = self.incoming_dir / latest_name
         logger.info(f"Found latest incoming ZIP: {latest_zip.name}")
         return latest_zip
     
@@ -159,31 +162,68 @@ class StorageService:
         
         return matches[0]  # Return first match
     
-    def list_archived_zips(self, limit: int = 10) -> list[dict]:
+    def _scan_zips(self, directory: Path) -> list[tuple[str, os.stat_result]]:
         """
-        List recently archived raw ZIPs.
+        Collect ZIP files in a directory with a single stat per entry.
         
         Args:
+            directory: Directory to scan
+            
+        Returns:
+            List of (filename, stat_result) tuples
+        """
+        results = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".zip") and entry.is_file():
+                        try:
+                            results.append((entry.name, entry.stat()))
+                        except FileNotFoundError:
+                            # Removed between listing and stat
+                            continue
+        except FileNotFoundError:
+            logger.warning(f"Storage directory missing: {directory}")
+        return results
+    
+    def _list_recent_zips(self, directory: Path, limit: int) -> list[dict]:
+        """
+        List the most recently modified ZIPs in a directory.
+        
+        Args:
+            directory: Directory to scan
             limit: Maximum number of files to return
             
         Returns:
             List of dicts with filename, size, and modification time
         """
-        zip_files = sorted(
-            self.raw_zip_dir.glob("*.zip"),
-            key=lambda p: p.stat().st_mtime,
-            reverse=True
-        )[:limit]
+        recent = heapq.nlargest(
+            limit,
+            self._scan_zips(directory),
+            key=lambda item: item[1].st_mtime
+        )
         
         return [
             {
-                "filename": f.name,
-                "size_mb": f.stat().st_size / (1024 * 1024),
-                "modified": datetime.fromtimestamp(f.stat().st_mtime).isoformat()
+                "filename": name,
+                "size_mb": st.st_size / (1024 * 1024),
+                "modified": datetime.fromtimestamp(st.st_mtime).isoformat()
             }
-            for f in zip_files
+            for name, st in recent
         ]
     
+    def list_archived_zips(self, limit: int = 10) -> list[dict]:
+        """
+        List recently archived raw ZIPs.
+        
+        Args:
+            limit: Maximum number of files to return
+            
+        Returns:
+            List of dicts with filename, size, and modification time
+        """
+        return self._list_recent_zips(self.raw_zip_dir, limit)
+    
     def list_output_zips(self, limit: int = 10) -> list[dict]:
         """
         List recently generated output ZIPs.
@@ -194,20 +234,7 @@ class StorageService:
         Returns:
             List of dicts with filename, size, and modification time
         """
-        zip_files = sorted(
-            self.out_zip_dir.glob("*.zip"),
-            key=lambda p: p.stat().st_mtime,
-            reverse=True
-        )[:limit]
-        
-        return [
-            {
-                "filename": f.name,
-                "size_mb": f.stat().st_size / (1024 * 1024),
-                "modified": datetime.fromtimestamp(f.stat().st_mtime).isoformat()
-            }
-            for f in zip_files
-        ]
+        return self._list_recent_zips(self.out_zip_dir, limit)
     
     def get_storage_stats(self) -> dict:
         """
@@ -217,8 +244,8 @@ class StorageService:
             Dict with counts and total sizes for each directory
         """
         def dir_stats(directory: Path) -> dict:
-            files = list(directory.glob("*.zip"))
-            total_size = sum(f.stat().st_size for f in files)
+            files = self._scan_zips(directory)
+            total_size = sum(st.st_size for _, st in files)
             return {
                 "count": len(files),
                 "total_size_mb": total_size / (1024 * 1024)
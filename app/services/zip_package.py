@@ -96,7 +96,7 @@ class ZipPackageService:
                 
                 # Generate and add manifest
                 manifest = self._generate_manifest(data, run_id, timestamp, metadata)
-                zipf.writestr("manifest.json", json.dumps(manifest, indent=2))
+                zipf.writestr("manifest.json", json.dumps(manifest, indent=2, default=str))
             
             file_size_mb = zip_path.stat().st_size / (1024 * 1024)
             logger.info(f"Package created successfully: {zip_filename} ({file_size_mb:.2f} MB)")